@@ -1,7 +1,6 @@
 """Analyze generated puzzle data to extract statistics."""
 
 import argparse
-import json
 import sys
 from collections import Counter
 from pathlib import Path
@@ -15,8 +14,14 @@ except ImportError:
 # Add parent directory to path to import from src
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src._json import JSONDecodeError, dumps, loads
 from src.models import Puzzle
 
+# Interned sentinel for statements without a 'type' field. Statement types come
+# from a small fixed vocabulary, so interning them makes the Counter updates
+# compare by pointer identity instead of character-by-character.
+_UNKNOWN = sys.intern("Unknown")
+
 
 def plot_analysis_results(results: dict, N: int, output_dir: Path) -> None:
     """Plot analysis results in multiple subplots and save as games_N.png.
@@ -68,10 +73,13 @@ def plot_analysis_results(results: dict, N: int, output_dir: Path) -> None:
     # Plot 2: General statement type distribution
     ax2 = axes[0, 1]
     stmt_dist = results.get("statement_type_distribution", {})
+    # Sort once by the general distribution (most frequent first) and reuse
+    # the same type order for the werewolf/shill subplots, so bars are
+    # aligned across subplots and only one sort runs.
+    sorted_items = sorted(stmt_dist.items(), key=lambda x: x[1], reverse=True)
+    type_order = [item[0] for item in sorted_items]
     if stmt_dist:
-        # Sort by count descending (most frequent first)
-        sorted_items = sorted(stmt_dist.items(), key=lambda x: x[1], reverse=True)
-        types = [item[0] for item in sorted_items]
+        types = type_order
         counts = [item[1] for item in sorted_items]
         total = sum(counts)
         percentages = [100 * c / total for c in counts] if total > 0 else counts
@@ -88,10 +96,9 @@ def plot_analysis_results(results: dict, N: int, output_dir: Path) -> None:
     ax3 = axes[1, 0]
     ww_stmt_dist = results.get("statement_type_distribution_werewolves", {})
     if ww_stmt_dist:
-        # Sort by count descending (most frequent first)
-        sorted_items = sorted(ww_stmt_dist.items(), key=lambda x: x[1], reverse=True)
-        types = [item[0] for item in sorted_items]
-        counts = [item[1] for item in sorted_items]
+        # Reuse the general distribution's type order (see Plot 2)
+        types = type_order
+        counts = [ww_stmt_dist.get(t, 0) for t in type_order]
         total = sum(counts)
         percentages = [100 * c / total for c in counts] if total > 0 else counts
         ax3.barh(types, percentages, color="crimson", edgecolor="black")
@@ -107,10 +114,9 @@ def plot_analysis_results(results: dict, N: int, output_dir: Path) -> None:
     ax4 = axes[1, 1]
     shill_stmt_dist = results.get("statement_type_distribution_shills", {})
     if shill_stmt_dist:
-        # Sort by count descending (most frequent first)
-        sorted_items = sorted(shill_stmt_dist.items(), key=lambda x: x[1], reverse=True)
-        types = [item[0] for item in sorted_items]
-        counts = [item[1] for item in sorted_items]
+        # Reuse the general distribution's type order (see Plot 2)
+        types = type_order
+        counts = [shill_stmt_dist.get(t, 0) for t in type_order]
         total = sum(counts)
         percentages = [100 * c / total for c in counts] if total > 0 else counts
         ax4.barh(types, percentages, color="darkorange", edgecolor="black")
@@ -156,9 +162,15 @@ def main() -> None:
 
     # Statistics to collect
     werewolf_count_distribution = Counter()
-    statement_type_distribution = Counter()
-    statement_type_distribution_werewolves = Counter()
-    statement_type_distribution_shills = Counter()
+
+    # Statement types form a small fixed vocabulary, so instead of three
+    # Counters keyed by strings we assign each type a dense integer id and
+    # tally into flat count lists (bincount-style). The string dict is only
+    # touched once per distinct type name.
+    type_id: dict[str, int] = {}
+    stmt_counts: list[int] = []
+    stmt_counts_werewolves: list[int] = []
+    stmt_counts_shills: list[int] = []
 
     # Convert file paths to Path objects
     jsonl_files = [Path(f) for f in args.files]
@@ -197,7 +209,7 @@ def main() -> None:
                     continue
 
                 try:
-                    puzzle_dict = json.loads(line)
+                    puzzle_dict = loads(line)
                     puzzle = Puzzle.from_dict(puzzle_dict)
                     puzzles_in_file += 1
                     total_puzzles += 1
@@ -222,8 +234,8 @@ def main() -> None:
                         )
                         continue
 
-                    # Werewolf count distribution
-                    werewolf_count = sum(1 for w in solution_assignment if w)
+                    # Werewolf count distribution (popcount on the packed mask)
+                    werewolf_count = puzzle.solution_mask().bit_count()
                     werewolf_count_distribution[werewolf_count] += 1
 
                     # Process statements by speaker
@@ -244,20 +256,29 @@ def main() -> None:
                         for statement in statements:
                             # Get statement type from the statement dict
                             stmt_dict = statement.to_dict()
-                            stmt_type = stmt_dict.get("type", "Unknown")
+                            stmt_type = sys.intern(stmt_dict.get("type") or _UNKNOWN)
+
+                            # Map the type name to a dense id (first time only)
+                            tid = type_id.get(stmt_type)
+                            if tid is None:
+                                tid = len(type_id)
+                                type_id[stmt_type] = tid
+                                stmt_counts.append(0)
+                                stmt_counts_werewolves.append(0)
+                                stmt_counts_shills.append(0)
 
                             # General distribution
-                            statement_type_distribution[stmt_type] += 1
+                            stmt_counts[tid] += 1
 
                             # Distribution for werewolves
                             if is_werewolf:
-                                statement_type_distribution_werewolves[stmt_type] += 1
+                                stmt_counts_werewolves[tid] += 1
 
                             # Distribution for shills
                             if is_shill:
-                                statement_type_distribution_shills[stmt_type] += 1
+                                stmt_counts_shills[tid] += 1
 
-                except json.JSONDecodeError as e:
+                except JSONDecodeError as e:
                     print(
                         f"Error parsing JSON at line {line_num} in {jsonl_file}: {e}",
                         file=sys.stderr,
@@ -279,21 +300,32 @@ def main() -> None:
         print("Warning: Could not determine N. Using 6 as default.", file=sys.stderr)
         N = 6
 
-    # Prepare output
+    # Prepare output: map dense ids back to type names, dropping zero entries
+    # so the dicts match what a per-category Counter would have contained.
     results = {
         "werewolf_count_distribution": dict(werewolf_count_distribution),
-        "statement_type_distribution": dict(statement_type_distribution),
-        "statement_type_distribution_werewolves": dict(
-            statement_type_distribution_werewolves
-        ),
-        "statement_type_distribution_shills": dict(statement_type_distribution_shills),
+        "statement_type_distribution": {
+            t: stmt_counts[tid] for t, tid in type_id.items() if stmt_counts[tid]
+        },
+        "statement_type_distribution_werewolves": {
+            t: stmt_counts_werewolves[tid]
+            for t, tid in type_id.items()
+            if stmt_counts_werewolves[tid]
+        },
+        "statement_type_distribution_shills": {
+            t: stmt_counts_shills[tid]
+            for t, tid in type_id.items()
+            if stmt_counts_shills[tid]
+        },
     }
 
     # Output as JSON
-    print(json.dumps(results, indent=2))
+    print(dumps(results, indent_2=True))
 
-    # Generate plots if requested
-    if not args.no_plot:
+    # Generate plots if requested (skip entirely when nothing was parsed:
+    # there is no point paying the matplotlib init/savefig cost to draw
+    # four "No data" panels)
+    if not args.no_plot and total_puzzles > 0 and any(results.values()):
         plot_analysis_results(results, N, output_dir)
 
 
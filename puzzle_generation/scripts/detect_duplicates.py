@@ -1,7 +1,6 @@
 """Check for duplicate games that are identical under permutation of villager indices."""
 
 import argparse
-import json
 import sys
 from collections import Counter
 from itertools import permutations
@@ -10,6 +9,7 @@ from pathlib import Path
 # Add parent directory to path to import from src
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src._json import JSONDecodeError, loads
 from src.models import Puzzle
 
 
@@ -292,10 +292,10 @@ def main() -> None:
                 continue
             
             try:
-                puzzle_dict = json.loads(line)
+                puzzle_dict = loads(line)
                 puzzle = Puzzle.from_dict(puzzle_dict)
                 puzzles.append((line_num, puzzle))
-            except json.JSONDecodeError as e:
+            except JSONDecodeError as e:
                 print(
                     f"Error parsing JSON at line {line_num} in {jsonl_file}: {e}",
                     file=sys.stderr,
@@ -1,7 +1,6 @@
 """Generate multiple puzzles for analysis."""
 
 import argparse
-import json
 import multiprocessing
 import sys
 from pathlib import Path
@@ -19,6 +18,7 @@ except ImportError:
         return iterable
 
 
+from src._json import dumps
 from src.generator import build_statement_library, generate_puzzle
 from src.models import GenerationConfig
 from src.truth_cache import StatementTruthTableCache
@@ -160,7 +160,7 @@ def main() -> None:
 
                     successful += 1
                     # Write full puzzle as JSON line
-                    f.write(json.dumps(puzzle_dict) + "\n")
+                    f.write(dumps(puzzle_dict) + "\n")
                     f.flush()
 
                     # Write statements-only as plain text line
@@ -178,7 +178,7 @@ def main() -> None:
                 # Convert puzzle to dict (includes solutions)
                 puzzle_dict = puzzle.to_dict()
                 # Write full puzzle as JSON line
-                f.write(json.dumps(puzzle_dict) + "\n")
+                f.write(dumps(puzzle_dict) + "\n")
                 f.flush()
 
                 # Extract only statements as short string
@@ -0,0 +1,77 @@
+"""JSON helpers with an optional orjson fast path.
+
+Serialization call sites import dumps/loads from here instead of the
+stdlib json module; when orjson is installed they transparently get its
+faster encoder/decoder, and otherwise fall back to the stdlib with the
+same signatures. orjson works in bytes, so dumps decodes at this
+boundary to keep the text-mode file I/O paths unchanged.
+"""
+
+import json as _stdlib_json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Decode-failure type matching whichever loads is active, so callers can
+# catch malformed input without caring which backend parsed it
+JSONDecodeError = (
+    orjson.JSONDecodeError if orjson is not None else _stdlib_json.JSONDecodeError
+)
+
+
+if orjson is not None:
+
+    def dumps(obj, *, indent_2: bool = False) -> str:
+        """Serialize an object to a JSON string.
+
+        Args:
+            obj: JSON-serializable object
+            indent_2: If True, pretty-print with two-space indentation
+
+        Returns:
+            JSON string
+        """
+        # OPT_NON_STR_KEYS matches the stdlib's coercion of int dict keys
+        # (e.g. the Counter-based distributions in analyze.py) to strings
+        option = orjson.OPT_NON_STR_KEYS
+        if indent_2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+
+    def loads(s):
+        """Parse a JSON string (or bytes).
+
+        Args:
+            s: JSON text
+
+        Returns:
+            Parsed Python object
+        """
+        return orjson.loads(s)
+
+else:
+
+    def dumps(obj, *, indent_2: bool = False) -> str:
+        """Serialize an object to a JSON string (stdlib fallback).
+
+        Args:
+            obj: JSON-serializable object
+            indent_2: If True, pretty-print with two-space indentation
+
+        Returns:
+            JSON string
+        """
+        return _stdlib_json.dumps(obj, indent=2 if indent_2 else None)
+
+    def loads(s):
+        """Parse a JSON string (stdlib fallback).
+
+        Args:
+            s: JSON text
+
+        Returns:
+            Parsed Python object
+        """
+        return _stdlib_json.loads(s)
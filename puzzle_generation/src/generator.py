@@ -195,6 +195,7 @@ WHY THIS APPROACH?
 """
 
 import random
+from functools import lru_cache
 from itertools import combinations
 from typing import TYPE_CHECKING
 
@@ -226,6 +227,12 @@ from .truth_cache import (
 )
 from .utils import get_default_names
 
+# Single generator-wide RNG instance. Bound methods on a local Random avoid
+# the extra indirection of the module-level random.* functions (each of which
+# dispatches through the hidden global instance) and give callers one object
+# to seed for reproducible generation.
+_rng = random.Random()
+
 
 def is_bundle_coherent_with_existing(
     bundle: list["Statement"],
@@ -353,11 +360,17 @@ def bundle_has_contradictory_statements(
     if len(bundle) <= 1:
         return False
 
-    for i, statement_a in enumerate(bundle):
-        for j, statement_b in enumerate(bundle):
-            if i < j:  # Check each pair only once
-                if statements_are_contradictory(statement_a, statement_b, truth_cache):
-                    return True
+    # Fetch each statement's mask once; the pairwise checks below are then
+    # pure int ops instead of O(k^2) cache lookups
+    masks = [truth_cache.get_truth_mask(statement) for statement in bundle]
+
+    for i in range(len(bundle)):
+        mask_a = masks[i]
+        for j in range(i + 1, len(bundle)):  # Check each pair only once
+            # Contradictory iff truth masks have no overlap (a statement is
+            # never considered contradictory with itself)
+            if (mask_a & masks[j]) == 0 and bundle[i] != bundle[j]:
+                return True
 
     return False
 
@@ -381,6 +394,10 @@ def filter_redundant_statements(
     if len(bundle) <= 1:
         return bundle
 
+    # Fetch each statement's mask once, then run the pairwise containment
+    # checks as pure int ops (see statement_contains_other for semantics)
+    masks = [truth_cache.get_truth_mask(statement) for statement in bundle]
+
     # Build a list of statements to keep
     # We'll check each statement against all others
     to_remove = set()
@@ -388,17 +405,23 @@ def filter_redundant_statements(
     for i, statement_a in enumerate(bundle):
         if i in to_remove:
             continue
+        mask_a = masks[i]
 
         for j, statement_b in enumerate(bundle):
             if i == j or j in to_remove:
                 continue
 
+            # A statement doesn't contain itself (avoid removing duplicates)
+            if statement_a == statement_b:
+                continue
+            mask_b = masks[j]
+
             # Check if statement_a contains statement_b
-            if statement_contains_other(statement_a, statement_b, truth_cache):
+            if (mask_a & ~mask_b) == 0:
                 # statement_a contains statement_b, so remove statement_b (the weaker one)
                 to_remove.add(j)
             # Check if statement_b contains statement_a
-            elif statement_contains_other(statement_b, statement_a, truth_cache):
+            elif (mask_b & ~mask_a) == 0:
                 # statement_b contains statement_a, so remove statement_a (the weaker one)
                 to_remove.add(i)
                 break  # No need to check further for statement_a
@@ -407,6 +430,31 @@ def filter_redundant_statements(
     return [statement for idx, statement in enumerate(bundle) if idx not in to_remove]
 
 
+@lru_cache(maxsize=None)
+def _valid_assignment_indices(
+    N: int, min_wolves: int, max_wolves: int
+) -> tuple[int, ...]:
+    """Enumerate assignment indices whose werewolf count lies in [min, max].
+
+    The werewolf count of assignment index i is simply its popcount, so the
+    filter runs on ints without building any assignment tuples. Cached because
+    every generation attempt re-enumerates the same (N, min, max) range.
+
+    Args:
+        N: Number of villagers
+        min_wolves: Minimum werewolf count (inclusive)
+        max_wolves: Maximum werewolf count (inclusive)
+
+    Returns:
+        Tuple of valid assignment indices
+    """
+    return tuple(
+        index
+        for index in range(1 << N)
+        if min_wolves <= index.bit_count() <= max_wolves
+    )
+
+
 def choose_target_assignment(
     config: GenerationConfig,
 ) -> tuple[tuple[bool, ...], tuple[bool, ...]]:
@@ -432,27 +480,22 @@ def choose_target_assignment(
 
     # If constraints on werewolf count, filter assignments
     if config.min_werewolves is not None or effective_max_werewolves is not None:
-        valid_assignments = []
         min_wolves = config.min_werewolves if config.min_werewolves is not None else 0
         max_wolves = (
             effective_max_werewolves if effective_max_werewolves is not None else N
         )
 
-        for assignment_idx in range(1 << N):
-            assignment = index_to_assignment(assignment_idx, N)
-            werewolf_count = sum(assignment)
-            if min_wolves <= werewolf_count <= max_wolves:
-                valid_assignments.append(assignment)
+        valid_indices = _valid_assignment_indices(N, min_wolves, max_wolves)
 
-        if valid_assignments:
-            W_star = random.choice(valid_assignments)
+        if valid_indices:
+            W_star = index_to_assignment(_rng.choice(valid_indices), N)
         else:
             # Fallback: choose uniformly at random
-            assignment_idx = random.randint(0, (1 << N) - 1)
+            assignment_idx = _rng.randint(0, (1 << N) - 1)
             W_star = index_to_assignment(assignment_idx, N)
     else:
         # Otherwise, choose uniformly at random
-        assignment_idx = random.randint(0, (1 << N) - 1)
+        assignment_idx = _rng.randint(0, (1 << N) - 1)
         W_star = index_to_assignment(assignment_idx, N)
 
     # Generate shill assignment if enabled
@@ -463,7 +506,7 @@ def choose_target_assignment(
             # No non-werewolves available, return all False for shills
             M_star = tuple(False for _ in range(N))
         else:
-            shill_index = random.choice(non_werewolves)
+            shill_index = _rng.choice(non_werewolves)
             M_star = tuple(i == shill_index for i in range(N))
     else:
         M_star = tuple(False for _ in range(N))
@@ -560,6 +603,36 @@ def build_statement_library(config: GenerationConfig) -> list["Statement"]:
     return statements
 
 
+def deduplicate_statement_library(
+    statement_library: list["Statement"],
+    truth_cache: StatementTruthTableCache,
+) -> list["Statement"]:
+    """Keep one statement per distinct truth mask.
+
+    Some library statements are logically equivalent by construction (e.g.
+    for small N, ExactlyOne(a, b) and a scoped exact count over the same
+    pair). Dropping the later duplicates up front means the candidate
+    filters never have to rediscover the equivalence bundle by bundle.
+    Library order is preserved, so relationship statements (which come
+    first and read more naturally) win over equivalent count statements.
+
+    Args:
+        statement_library: Library of statements to deduplicate
+        truth_cache: Truth table cache
+
+    Returns:
+        Library with at most one statement per truth mask
+    """
+    seen_masks: set[int] = set()
+    deduplicated = []
+    for statement in statement_library:
+        mask = truth_cache.get_truth_mask(statement)
+        if mask not in seen_masks:
+            seen_masks.add(mask)
+            deduplicated.append(statement)
+    return deduplicated
+
+
 def list_candidate_bundles_for_speaker(
     speaker_index: int,
     W_star: tuple[bool, ...],
@@ -567,7 +640,7 @@ def list_candidate_bundles_for_speaker(
     statement_library: list["Statement"],
     truth_cache: StatementTruthTableCache,
     config: GenerationConfig,
-) -> list[list["Statement"]]:
+) -> list[tuple["Statement", ...]]:
     """List candidate statement bundles for a speaker consistent with W_star and M_star.
 
     Args:
@@ -590,14 +663,17 @@ def list_candidate_bundles_for_speaker(
         """
         if len(bundle) < 2:
             return False
-        v0 = bundle[0].variables_involved()
-        v1 = bundle[1].variables_involved()
-        return len(v0) == 2 and v0 == v1
+        m0 = bundle[0].variables_involved_mask()
+        m1 = bundle[1].variables_involved_mask()
+        return m0 == m1 and m0.bit_count() == 2
 
     # Filter statements that don't violate self-reference rule
     if config.forbid_self_reference:
+        speaker_bit = 1 << speaker_index
         available_statements = [
-            c for c in statement_library if speaker_index not in c.variables_involved()
+            c
+            for c in statement_library
+            if not (c.variables_involved_mask() & speaker_bit)
         ]
     else:
         available_statements = statement_library
@@ -609,81 +685,76 @@ def list_candidate_bundles_for_speaker(
     is_shill = M_star[speaker_index]
     can_lie = is_wolf or is_shill
 
+    # W_star is fixed for this whole call, so each statement's truth under it
+    # is a single bit of its truth mask. Read those bits once up front rather
+    # than calling evaluate_on_assignment for every sampled combination.
+    w_star_index = assignment_to_index(W_star)
+    true_at_w_star = [
+        bool((truth_cache.get_truth_mask(statement) >> w_star_index) & 1)
+        for statement in available_statements
+    ]
+
     candidate_bundles = []
     min_statements = config.statements_per_speaker_min
     max_statements = config.statements_per_speaker_max
+    num_available = len(available_statements)
 
     # Generate bundles of size min_statements to max_statements
     for bundle_size in range(min_statements, max_statements + 1):
         # Sample combinations (don't enumerate all if too many)
-        if len(available_statements) < 20:
-            # Small library: enumerate all combinations
-            for bundle in combinations(available_statements, bundle_size):
-                bundle_list = list(bundle)
-                # Check consistency with W_star
-                all_true = all(
-                    statement.evaluate_on_assignment(W_star)
-                    for statement in bundle_list
-                )
+        if num_available < 20:
+            # Small library: enumerate all combinations (by index so the
+            # precomputed truth bits line up)
+            for index_bundle in combinations(range(num_available), bundle_size):
+                # Check consistency with W_star before materializing the
+                # statement list: most combinations fail this cheap test
+                all_true = all(true_at_w_star[i] for i in index_bundle)
 
                 if can_lie:
                     # Wolf or shill: at least one must be false
-                    if not all_true:
-                        # Filter out bundles with contradictory statements (would make it obvious they're a werewolf/shill)
-                        if bundle_has_contradictory_statements(
-                            bundle_list, truth_cache
-                        ):
-                            continue
-                        # Filter redundant statements before adding
-                        filtered_bundle = filter_redundant_statements(
-                            bundle_list, truth_cache
-                        )
-                        # Only add if bundle meets minimum size requirement after filtering
-                        if len(filtered_bundle) >= min_statements:
-                            candidate_bundles.append(filtered_bundle)
+                    if all_true:
+                        continue
+                    bundle_list = [available_statements[i] for i in index_bundle]
+                    # Filter out bundles with contradictory statements (would make it obvious they're a werewolf/shill)
+                    if bundle_has_contradictory_statements(bundle_list, truth_cache):
+                        continue
                 else:
                     # Human: all must be true
-                    if all_true:
-                        # Filter redundant statements before adding
-                        filtered_bundle = filter_redundant_statements(
-                            bundle_list, truth_cache
-                        )
-                        # Only add if bundle meets minimum size requirement after filtering
-                        if len(filtered_bundle) >= min_statements:
-                            candidate_bundles.append(filtered_bundle)
+                    if not all_true:
+                        continue
+                    bundle_list = [available_statements[i] for i in index_bundle]
+
+                # Filter redundant statements before adding
+                filtered_bundle = filter_redundant_statements(bundle_list, truth_cache)
+                # Only add if bundle meets minimum size requirement after filtering
+                if len(filtered_bundle) >= min_statements:
+                    candidate_bundles.append(tuple(filtered_bundle))
         else:
-            # Large library: sample randomly
+            # Large library: sample randomly (by index so the precomputed
+            # truth bits line up)
             for _ in range(config.greedy_candidate_pool_size):
-                bundle = random.sample(available_statements, bundle_size)
-                bundle_list = list(bundle)
-                all_true = all(
-                    statement.evaluate_on_assignment(W_star)
-                    for statement in bundle_list
-                )
+                index_bundle = _rng.sample(range(num_available), bundle_size)
+                # Cheap truth check first; only materialize the statement
+                # list for bundles that survive it
+                all_true = all(true_at_w_star[i] for i in index_bundle)
 
                 if can_lie:
-                    if not all_true:
-                        # Filter out bundles with contradictory statements (would make it obvious they're a werewolf/shill)
-                        if bundle_has_contradictory_statements(
-                            bundle_list, truth_cache
-                        ):
-                            continue
-                        # Filter redundant statements before adding
-                        filtered_bundle = filter_redundant_statements(
-                            bundle_list, truth_cache
-                        )
-                        # Only add if bundle meets minimum size requirement after filtering
-                        if len(filtered_bundle) >= min_statements:
-                            candidate_bundles.append(filtered_bundle)
-                else:
                     if all_true:
-                        # Filter redundant statements before adding
-                        filtered_bundle = filter_redundant_statements(
-                            bundle_list, truth_cache
-                        )
-                        # Only add if bundle meets minimum size requirement after filtering
-                        if len(filtered_bundle) >= min_statements:
-                            candidate_bundles.append(filtered_bundle)
+                        continue
+                    bundle_list = [available_statements[i] for i in index_bundle]
+                    # Filter out bundles with contradictory statements (would make it obvious they're a werewolf/shill)
+                    if bundle_has_contradictory_statements(bundle_list, truth_cache):
+                        continue
+                else:
+                    if not all_true:
+                        continue
+                    bundle_list = [available_statements[i] for i in index_bundle]
+
+                # Filter redundant statements before adding
+                filtered_bundle = filter_redundant_statements(bundle_list, truth_cache)
+                # Only add if bundle meets minimum size requirement after filtering
+                if len(filtered_bundle) >= min_statements:
+                    candidate_bundles.append(tuple(filtered_bundle))
 
     # Preference: if we have enough options, avoid bundles where statement 1 and statement 2
     # talk about the exact same two people (better narrative variety).
@@ -708,21 +779,15 @@ def compute_bundle_all_true_mask(
     Returns:
         Bitmask where bit i is set if all statements are true under assignment i
     """
-    N = truth_cache.N
-    num_assignments = 1 << N  # 2^N assignments
-
     if not bundle:
         # Empty bundle: all assignments satisfy (all true)
-        return (1 << num_assignments) - 1  # All bits set for 2^N assignments
-
-    # Start with all assignments
-    all_assignments_mask = (1 << num_assignments) - 1
-    result_mask = all_assignments_mask
+        return truth_cache.all_assignments_mask
 
-    # Intersect with truth mask of each statement
-    for statement in bundle:
-        truth_mask = truth_cache.get_truth_mask(statement)
-        result_mask &= truth_mask
+    # Start from the first statement's mask and intersect with the rest
+    # (avoids materializing a fresh all-ones mask per call)
+    result_mask = truth_cache.get_truth_mask(bundle[0])
+    for statement in bundle[1:]:
+        result_mask &= truth_cache.get_truth_mask(statement)
 
     return result_mask
 
@@ -731,8 +796,7 @@ def compute_speaker_compatibility_mask(
     speaker_index: int,
     bundle: list["Statement"],
     human_mask: int,
-    wolf_mask: int,
-    shill_mask: int | None,
+    lying_mask: int,
     truth_cache: StatementTruthTableCache,
 ) -> int:
     """Compute compatibility mask for a speaker with a given bundle.
@@ -746,31 +810,31 @@ def compute_speaker_compatibility_mask(
         speaker_index: Index of the speaker
         bundle: List of statements made by the speaker
         human_mask: Precomputed mask of assignments where speaker is human
-        wolf_mask: Precomputed mask of assignments where speaker is wolf
-        shill_mask: Precomputed mask of assignments where speaker is shill (None if shills disabled)
+        lying_mask: Precomputed mask of assignments where speaker must lie
+            (wolf mask, OR'd with the shill mask when shills are enabled)
         truth_cache: Truth table cache
 
     Returns:
         Bitmask of compatible assignments
     """
-    bundle_all_true_mask = compute_bundle_all_true_mask(bundle, truth_cache)
-    N = truth_cache.N
-    num_assignments = 1 << N
-    all_assignments_mask = (1 << num_assignments) - 1
-
-    if shill_mask is not None:
-        # Humans: must be in bundle_all_true_mask
-        # Wolves and shills: must be in NOT bundle_all_true_mask
-        compat_mask = (human_mask & bundle_all_true_mask) | (
-            (wolf_mask | shill_mask) & (all_assignments_mask & (~bundle_all_true_mask))
-        )
+    # Fused bundle-truth reduction (same as compute_bundle_all_true_mask,
+    # inlined so the whole compatibility computation is one pass without an
+    # extra call per candidate)
+    if bundle:
+        bundle_all_true_mask = truth_cache.get_truth_mask(bundle[0])
+        for statement in bundle[1:]:
+            bundle_all_true_mask &= truth_cache.get_truth_mask(statement)
     else:
-        # Original logic: Humans tell truth, wolves lie
-        compat_mask = (human_mask & bundle_all_true_mask) | (
-            wolf_mask & (all_assignments_mask & (~bundle_all_true_mask))
-        )
-
-    return compat_mask
+        bundle_all_true_mask = truth_cache.all_assignments_mask
+
+    # Humans: must be in bundle_all_true_mask
+    # Wolves and shills: must be in NOT bundle_all_true_mask.
+    # ANDing ~bundle_all_true_mask with the non-negative lying_mask already
+    # clips the result to the 2^N assignment bits, so no explicit AND with
+    # all_assignments_mask is needed.
+    return (human_mask & bundle_all_true_mask) | (
+        lying_mask & ~bundle_all_true_mask
+    )
 
 
 def get_statement_types(bundle: list["Statement"]) -> set[str]:
@@ -785,10 +849,51 @@ def get_statement_types(bundle: list["Statement"]) -> set[str]:
     return {type(stmt).__name__ for stmt in bundle}
 
 
+# One bit per statement class, assigned on first sight. Lets the diversity
+# filter compare bundles against claimed types with a single AND instead of
+# building and differencing sets of class-name strings per candidate.
+_type_bits: dict[type, int] = {}
+
+
+def get_bundle_type_mask(bundle: list["Statement"]) -> int:
+    """Compute a bitmask encoding the set of statement classes in a bundle.
+
+    Args:
+        bundle: List of statements
+
+    Returns:
+        Bitmask with one bit set per distinct statement class
+    """
+    mask = 0
+    for stmt in bundle:
+        cls = type(stmt)
+        bit = _type_bits.get(cls)
+        if bit is None:
+            bit = 1 << len(_type_bits)
+            _type_bits[cls] = bit
+        mask |= bit
+    return mask
+
+
+def iter_set_bits(mask: int):
+    """Yield the indices of set bits in a mask, lowest first.
+
+    Args:
+        mask: Integer bitmask
+
+    Yields:
+        Index of each set bit (isolated via mask & -mask)
+    """
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
 def greedy_assign_statements_until_unique(
     W_star: tuple[bool, ...],
     M_star: tuple[bool, ...],
-    candidate_bundles_by_speaker: list[list[list["Statement"]]],
+    candidate_bundles_by_speaker: list[list[tuple["Statement", ...]]],
     truth_cache: StatementTruthTableCache,
     config: GenerationConfig,
 ) -> Puzzle | None:
@@ -806,8 +911,7 @@ def greedy_assign_statements_until_unique(
     """
     N = config.N
     W_star_index = assignment_to_index(W_star)
-    num_assignments = 1 << N
-    all_assignments_mask = (1 << num_assignments) - 1
+    all_assignments_mask = truth_cache.all_assignments_mask
 
     # Precompute human/wolf masks
     human_mask_by_speaker, wolf_mask_by_speaker = compute_human_wolf_masks(N)
@@ -817,25 +921,69 @@ def greedy_assign_statements_until_unique(
     if config.has_shill:
         shill_mask_by_speaker = compute_shill_masks(N, M_star)
 
+    # Precompute each candidate bundle's compatibility mask once: it depends
+    # only on the speaker and the bundle, not on remaining_mask, so scoring a
+    # candidate inside the greedy loop reduces to one AND plus popcounts.
+    # Candidates whose mask already eliminates W_star are dropped here with a
+    # single bit-test: remaining_mask always retains the W_star bit, so
+    # remaining & compat keeps W_star iff compat does, and the greedy loops
+    # never need to re-check it per iteration.
+    w_star_bit = 1 << W_star_index
+    filtered_bundles_by_speaker: list[list[tuple["Statement", ...]]] = []
+    compat_masks_by_speaker: list[list[int]] = []
+    compat_popcounts_by_speaker: list[list[int]] = []
+    type_masks_by_speaker: list[list[int]] = []
+    for speaker_idx in range(N):
+        # Hoisted per speaker: who must lie is wolf | shill and never changes
+        # across this speaker's candidates
+        lying_mask = wolf_mask_by_speaker[speaker_idx]
+        if shill_mask_by_speaker is not None:
+            lying_mask |= shill_mask_by_speaker[speaker_idx]
+        kept_bundles: list[tuple["Statement", ...]] = []
+        kept_masks: list[int] = []
+        kept_popcounts: list[int] = []
+        kept_type_masks: list[int] = []
+        for bundle in candidate_bundles_by_speaker[speaker_idx]:
+            compat_mask = compute_speaker_compatibility_mask(
+                speaker_idx,
+                bundle,
+                human_mask_by_speaker[speaker_idx],
+                lying_mask,
+                truth_cache,
+            )
+            if compat_mask & w_star_bit:
+                kept_bundles.append(bundle)
+                kept_masks.append(compat_mask)
+                kept_popcounts.append(compat_mask.bit_count())
+                kept_type_masks.append(get_bundle_type_mask(bundle))
+        filtered_bundles_by_speaker.append(kept_bundles)
+        compat_masks_by_speaker.append(kept_masks)
+        compat_popcounts_by_speaker.append(kept_popcounts)
+        type_masks_by_speaker.append(kept_type_masks)
+    candidate_bundles_by_speaker = filtered_bundles_by_speaker
+
     # Track remaining possible assignments
     remaining_mask = all_assignments_mask
 
     # Track assigned bundles
     assigned_bundles: list[list["Statement"] | None] = [None] * N
-    unassigned_speakers = list(range(N))
+    # Unassigned speakers as a bitmask (bit i = speaker i unassigned):
+    # removal is one AND instead of an O(N) list scan
+    unassigned_mask = (1 << N) - 1
 
-    # Track claimed statement types for diversity enforcement
-    claimed_statement_types: set[str] = set()
+    # Track claimed statement types (as a class bitmask) for diversity
+    # enforcement
+    claimed_type_mask = 0
 
     # Track accusations and vouchings for coherence filtering (truthful speakers only)
     existing_accusations: set[tuple[int, int]] = set()
     existing_vouchings: set[tuple[int, int]] = set()
 
     # Phase 1: Greedy assignment until uniqueness is achieved
-    while unassigned_speakers and remaining_mask != (1 << W_star_index):
+    while unassigned_mask and remaining_mask != (1 << W_star_index):
         # Shuffle speaker order each iteration for randomness
-        shuffled_speakers = unassigned_speakers.copy()
-        random.shuffle(shuffled_speakers)
+        shuffled_speakers = list(iter_set_bits(unassigned_mask))
+        _rng.shuffle(shuffled_speakers)
 
         # Collect top candidates instead of just the best one
         top_candidates: list[
@@ -843,31 +991,47 @@ def greedy_assign_statements_until_unique(
         ] = []  # (speaker, bundle, new_mask, eliminations)
         best_eliminations = -1
 
+        # Hoisted out of the candidate loop: remaining_mask is fixed for the
+        # whole scan. A candidate eliminating max_eliminations assignments
+        # drives the mask straight to uniqueness (only W_star left) - nothing
+        # can beat that, so the scan stops as soon as one is found.
+        current_popcount = remaining_mask.bit_count()
+        max_eliminations = current_popcount - 1
+        # On the first iteration remaining_mask is all ones, so each
+        # candidate's new mask is its own compat mask and the cached
+        # popcount scores it without any AND or recount.
+        remaining_is_full = remaining_mask == all_assignments_mask
+
         # Try each unassigned speaker
         for speaker_idx in shuffled_speakers:
+            if best_eliminations >= max_eliminations:
+                break  # Already found a uniqueness-achieving bundle
             candidate_bundles = candidate_bundles_by_speaker[speaker_idx]
-
-            # Sample a subset if too many
-            if len(candidate_bundles) > config.greedy_candidate_pool_size:
-                candidate_bundles = random.sample(
-                    candidate_bundles, config.greedy_candidate_pool_size
+            compat_masks = compat_masks_by_speaker[speaker_idx]
+            compat_popcounts = compat_popcounts_by_speaker[speaker_idx]
+            type_masks = type_masks_by_speaker[speaker_idx]
+
+            # Sample a subset of candidate indices if too many, else shuffle
+            candidate_indices = list(range(len(candidate_bundles)))
+            if len(candidate_indices) > config.greedy_candidate_pool_size:
+                candidate_indices = _rng.sample(
+                    candidate_indices, config.greedy_candidate_pool_size
                 )
-
-            # Shuffle candidate bundles for this speaker
-            candidate_bundles = list(candidate_bundles)
-            random.shuffle(candidate_bundles)
+            else:
+                _rng.shuffle(candidate_indices)
 
             # Try each candidate bundle
-            for bundle in candidate_bundles:
+            for candidate_idx in candidate_indices:
+                bundle = candidate_bundles[candidate_idx]
+
                 # Ensure bundle meets minimum size requirement
                 if len(bundle) < config.statements_per_speaker_min:
                     continue
 
-                # Enforce diversity: bundle must contain at least one unclaimed statement type
+                # Enforce diversity: bundle must contain at least one unclaimed
+                # statement type (single AND on precomputed class bitmasks)
                 if config.diverse_statements:
-                    bundle_types = get_statement_types(bundle)
-                    # Check if bundle has at least one unclaimed type
-                    if not (bundle_types - claimed_statement_types):
+                    if not (type_masks[candidate_idx] & ~claimed_type_mask):
                         continue  # All types in bundle are already claimed, skip it
 
                 # Enforce coherence: bundle must not conflict with existing accusations/vouchings
@@ -881,29 +1045,15 @@ def greedy_assign_statements_until_unique(
                     ):
                         continue  # Bundle conflicts with existing statements
 
-                shill_mask = (
-                    shill_mask_by_speaker[speaker_idx]
-                    if shill_mask_by_speaker is not None
-                    else None
-                )
-                compat_mask = compute_speaker_compatibility_mask(
-                    speaker_idx,
-                    bundle,
-                    human_mask_by_speaker[speaker_idx],
-                    wolf_mask_by_speaker[speaker_idx],
-                    shill_mask,
-                    truth_cache,
-                )
-
-                # New remaining mask after adding this bundle
-                new_mask = remaining_mask & compat_mask
-
-                # Check if W_star is still possible
-                if not (new_mask & (1 << W_star_index)):
-                    continue  # This bundle eliminates W_star, skip it
-
-                # Count how many assignments this eliminates
-                eliminations = bin(remaining_mask).count("1") - bin(new_mask).count("1")
+                # New remaining mask after adding this bundle. W_star stays
+                # possible by construction: candidates eliminating it were
+                # filtered out during the compat-mask precomputation.
+                if remaining_is_full:
+                    new_mask = compat_masks[candidate_idx]
+                    eliminations = current_popcount - compat_popcounts[candidate_idx]
+                else:
+                    new_mask = remaining_mask & compat_masks[candidate_idx]
+                    eliminations = current_popcount - new_mask.bit_count()
 
                 # Track best eliminations for threshold calculation
                 if eliminations > best_eliminations:
@@ -912,6 +1062,9 @@ def greedy_assign_statements_until_unique(
                 # Add to candidates pool
                 top_candidates.append((speaker_idx, bundle, new_mask, eliminations))
 
+                if eliminations >= max_eliminations:
+                    break  # Uniqueness-achieving bundle: stop scanning
+
         # If no bundle found that keeps W_star, fail
         if not top_candidates:
             return None
@@ -925,17 +1078,17 @@ def greedy_assign_statements_until_unique(
             good_candidates = top_candidates  # Fallback to all candidates
 
         # Randomly select from good candidates
-        chosen = random.choice(good_candidates)
+        chosen = _rng.choice(good_candidates)
         best_speaker, best_bundle, best_new_mask, _ = chosen
 
         # Assign the chosen bundle
         assigned_bundles[best_speaker] = best_bundle
         remaining_mask = best_new_mask
-        unassigned_speakers.remove(best_speaker)
+        unassigned_mask &= ~(1 << best_speaker)
 
         # Mark statement types as claimed for diversity enforcement
         if config.diverse_statements:
-            claimed_statement_types.update(get_statement_types(best_bundle))
+            claimed_type_mask |= get_bundle_type_mask(best_bundle)
 
         # Track accusations and vouchings for coherence filtering (truthful speakers only)
         is_wolf = W_star[best_speaker]
@@ -954,41 +1107,42 @@ def greedy_assign_statements_until_unique(
 
     # Phase 2: Assign bundles to remaining speakers while maintaining uniqueness
     # Once uniqueness is achieved, any bundle consistent with W_star will maintain it
-    while unassigned_speakers:
+    while unassigned_mask:
         # Shuffle speaker order for randomness
-        shuffled_speakers = unassigned_speakers.copy()
-        random.shuffle(shuffled_speakers)
+        shuffled_speakers = list(iter_set_bits(unassigned_mask))
+        _rng.shuffle(shuffled_speakers)
 
         # Collect all valid candidates for this phase
         valid_candidates: list[
-            tuple[int, list["Statement"], int]
-        ] = []  # (speaker, bundle, new_mask)
+            tuple[int, list["Statement"]]
+        ] = []  # (speaker, bundle)
 
         # Try each unassigned speaker
         for speaker_idx in shuffled_speakers:
             candidate_bundles = candidate_bundles_by_speaker[speaker_idx]
+            type_masks = type_masks_by_speaker[speaker_idx]
 
-            # Sample a subset if too many
-            if len(candidate_bundles) > config.greedy_candidate_pool_size:
-                candidate_bundles = random.sample(
-                    candidate_bundles, config.greedy_candidate_pool_size
+            # Sample a subset of candidate indices if too many, else shuffle
+            candidate_indices = list(range(len(candidate_bundles)))
+            if len(candidate_indices) > config.greedy_candidate_pool_size:
+                candidate_indices = _rng.sample(
+                    candidate_indices, config.greedy_candidate_pool_size
                 )
-
-            # Shuffle candidate bundles
-            candidate_bundles = list(candidate_bundles)
-            random.shuffle(candidate_bundles)
+            else:
+                _rng.shuffle(candidate_indices)
 
             # Try each candidate bundle
-            for bundle in candidate_bundles:
+            for candidate_idx in candidate_indices:
+                bundle = candidate_bundles[candidate_idx]
+
                 # Ensure bundle meets minimum size requirement
                 if len(bundle) < config.statements_per_speaker_min:
                     continue
 
-                # Enforce diversity: bundle must contain at least one unclaimed statement type
+                # Enforce diversity: bundle must contain at least one unclaimed
+                # statement type (single AND on precomputed class bitmasks)
                 if config.diverse_statements:
-                    bundle_types = get_statement_types(bundle)
-                    # Check if bundle has at least one unclaimed type
-                    if not (bundle_types - claimed_statement_types):
+                    if not (type_masks[candidate_idx] & ~claimed_type_mask):
                         continue  # All types in bundle are already claimed, skip it
 
                 # Enforce coherence: bundle must not conflict with existing accusations/vouchings
@@ -1002,45 +1156,27 @@ def greedy_assign_statements_until_unique(
                     ):
                         continue  # Bundle conflicts with existing statements
 
-                shill_mask = (
-                    shill_mask_by_speaker[speaker_idx]
-                    if shill_mask_by_speaker is not None
-                    else None
-                )
-                compat_mask = compute_speaker_compatibility_mask(
-                    speaker_idx,
-                    bundle,
-                    human_mask_by_speaker[speaker_idx],
-                    wolf_mask_by_speaker[speaker_idx],
-                    shill_mask,
-                    truth_cache,
-                )
-
-                # New remaining mask after adding this bundle
-                new_mask = remaining_mask & compat_mask
-
-                # Check if W_star is still possible (this maintains uniqueness since
-                # remaining_mask already only contains W_star_index)
-                if new_mask & (1 << W_star_index):
-                    # This bundle is consistent with W_star, add to candidates
-                    valid_candidates.append((speaker_idx, bundle, new_mask))
+                # No mask update is needed in this phase: remaining_mask is
+                # already just the W_star bit and every surviving candidate
+                # keeps that bit (the compat-mask precomputation filtered out
+                # the rest), so ANDing would return remaining_mask unchanged.
+                valid_candidates.append((speaker_idx, bundle))
 
         # If no bundle found that keeps W_star, fail
         if not valid_candidates:
             return None
 
         # Randomly select from valid candidates
-        chosen = random.choice(valid_candidates)
-        best_speaker, best_bundle, best_new_mask = chosen
+        chosen = _rng.choice(valid_candidates)
+        best_speaker, best_bundle = chosen
 
-        # Assign the bundle
+        # Assign the bundle (remaining_mask stays the lone W_star bit)
         assigned_bundles[best_speaker] = best_bundle
-        remaining_mask = best_new_mask
-        unassigned_speakers.remove(best_speaker)
+        unassigned_mask &= ~(1 << best_speaker)
 
         # Mark statement types as claimed for diversity enforcement
         if config.diverse_statements:
-            claimed_statement_types.update(get_statement_types(best_bundle))
+            claimed_type_mask |= get_bundle_type_mask(best_bundle)
 
         # Track accusations and vouchings for coherence filtering (truthful speakers only)
         is_wolf = W_star[best_speaker]
@@ -1104,14 +1240,18 @@ def generate_puzzle(
     Returns:
         Puzzle if successful, None if generation failed after max_attempts
     """
+    # Build the statement library once: it depends only on the config, not on
+    # the target assignment, so rebuilding (and re-deduplicating) it on every
+    # attempt would just redo identical work.
+    statement_library = deduplicate_statement_library(
+        build_statement_library(config), truth_cache
+    )
+
     for attempt in range(config.max_attempts):
         # Step 1: Choose target assignment (both werewolf and shill)
         W_star, M_star = choose_target_assignment(config)
 
-        # Step 2: Build statement library
-        statement_library = build_statement_library(config)
-
-        # Step 3: Generate candidate bundles for each speaker
+        # Step 2: Generate candidate bundles for each speaker
         candidate_bundles_by_speaker = []
         for speaker_idx in range(config.N):
             bundles = list_candidate_bundles_for_speaker(
@@ -1124,7 +1264,7 @@ def generate_puzzle(
             )
             candidate_bundles_by_speaker.append(bundles)
 
-        # Step 4: Greedy assignment
+        # Step 3: Greedy assignment
         puzzle = greedy_assign_statements_until_unique(
             W_star,
             M_star,
@@ -1136,7 +1276,7 @@ def generate_puzzle(
         if puzzle is None:
             continue  # Try again
 
-        # Step 5: Verify with Z3 (sanity check) and compute difficulty
+        # Step 4: Verify with Z3 (sanity check) and compute difficulty
         from .solver import PuzzleSolver
 
         if PuzzleSolver.is_uniquely_satisfiable(puzzle):
@@ -1,28 +1,42 @@
 """Core data models for the werewolf puzzle generator."""
 
-from dataclasses import asdict, dataclass
+import json
+import sys
+from dataclasses import dataclass, field, fields
+from itertools import chain
 from typing import TYPE_CHECKING
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from .statements import Statement
 
 from .statements import Statement  # Import for runtime use in from_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Villager:
     """Represents a villager in the puzzle."""
 
     index: int
     name: str
 
+    def __post_init__(self):
+        # The same handful of names recurs across every puzzle in a dataset
+        # run; interning deduplicates the strings and makes name comparisons
+        # pointer-equality checks.
+        self.name = sys.intern(self.name)
+
     def to_dict(self) -> dict:
         """Convert villager to dictionary.
 
         Returns:
             Dictionary representation of the villager
         """
-        return asdict(self)
+        return {"index": self.index, "name": self.name}
 
     @classmethod
     def from_dict(cls, data: dict) -> "Villager":
@@ -34,10 +48,10 @@ class Villager:
         Returns:
             Villager instance
         """
-        return cls(**data)
+        return cls(index=data["index"], name=data["name"])
 
 
-@dataclass
+@dataclass(slots=True)
 class Puzzle:
     """Represents a complete werewolf puzzle."""
 
@@ -46,6 +60,76 @@ class Puzzle:
     difficulty_score: float = 0.0
     solution_assignment: tuple[bool, ...] | None = None
     shill_assignment: tuple[bool, ...] | None = None
+    # Manual caches (cached_property needs a __dict__, which slots=True
+    # removes); filled lazily by werewolf_indices/shill_indices
+    _werewolf_indices: tuple[int, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _shill_indices: tuple[int, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def werewolf_indices(self) -> tuple[int, ...]:
+        """Return the indices of the werewolves in the solution.
+
+        Scans the assignment tuple once and caches the result, so multiple
+        renders of the same puzzle (text plus markdown) share one scan.
+        Returns an empty tuple when no solution is set.
+
+        Returns:
+            Tuple of villager indices that are werewolves
+        """
+        if self._werewolf_indices is None:
+            assignment = self.solution_assignment or ()
+            self._werewolf_indices = tuple(
+                i for i, is_wolf in enumerate(assignment) if is_wolf
+            )
+        return self._werewolf_indices
+
+    def shill_indices(self) -> tuple[int, ...]:
+        """Return the indices of the shills, cached after the first scan.
+
+        Returns:
+            Tuple of villager indices that are shills (empty if unset)
+        """
+        if self._shill_indices is None:
+            assignment = self.shill_assignment or ()
+            self._shill_indices = tuple(
+                i for i, is_shill in enumerate(assignment) if is_shill
+            )
+        return self._shill_indices
+
+    def solution_mask(self) -> int | None:
+        """Return the solution assignment packed as an int bitmask.
+
+        Bit i is set if villager i is a werewolf. Callers that count or
+        compare assignments can use bitwise ops and int.bit_count on the
+        mask instead of iterating the bool tuple.
+
+        Returns:
+            Bitmask of werewolf indices, or None if no solution is set
+        """
+        if self.solution_assignment is None:
+            return None
+        mask = 0
+        for i, is_wolf in enumerate(self.solution_assignment):
+            if is_wolf:
+                mask |= 1 << i
+        return mask
+
+    def shill_mask(self) -> int | None:
+        """Return the shill assignment packed as an int bitmask.
+
+        Returns:
+            Bitmask of shill indices, or None if no shill assignment is set
+        """
+        if self.shill_assignment is None:
+            return None
+        mask = 0
+        for i, is_shill in enumerate(self.shill_assignment):
+            if is_shill:
+                mask |= 1 << i
+        return mask
 
     def to_short_statements_string(self) -> str:
         """Return a short string representation of all statements.
@@ -53,11 +137,10 @@ class Puzzle:
         Returns:
             String like "I-5-7_N-3-4_B-0-1" where statements are separated by underscores
         """
-        all_statements = []
-        for bundle in self.statements_by_speaker:
-            for stmt in bundle:
-                all_statements.append(stmt.to_short_string())
-        return "_".join(all_statements)
+        return "_".join(
+            stmt.to_short_string()
+            for stmt in chain.from_iterable(self.statements_by_speaker)
+        )
 
     def to_dict(self) -> dict:
         """Convert puzzle to dictionary.
@@ -68,58 +151,87 @@ class Puzzle:
         Returns:
             Dictionary representation of the puzzle
         """
-        data = asdict(self)
-        # Convert villagers using their to_dict method
-        data["villagers"] = [v.to_dict() for v in self.villagers]
-        # Convert Statement objects to dictionaries
-        data["statements_by_speaker"] = [
-            [stmt.to_dict() for stmt in bundle] for bundle in self.statements_by_speaker
-        ]
-        # Convert tuples to lists for JSON compatibility
-        if self.solution_assignment is not None:
-            data["solution_assignment"] = list(self.solution_assignment)
-        if self.shill_assignment is not None:
-            data["shill_assignment"] = list(self.shill_assignment)
-        return data
+        # Built by hand rather than via asdict(): asdict deep-copies the
+        # whole dataclass tree (including every Statement) only for those
+        # copies to be replaced by the to_dict() versions below.
+        return {
+            "villagers": [v.to_dict() for v in self.villagers],
+            "statements_by_speaker": [
+                [stmt.to_dict() for stmt in bundle]
+                for bundle in self.statements_by_speaker
+            ],
+            "difficulty_score": self.difficulty_score,
+            "solution_assignment": (
+                list(self.solution_assignment)
+                if self.solution_assignment is not None
+                else None
+            ),
+            "shill_assignment": (
+                list(self.shill_assignment)
+                if self.shill_assignment is not None
+                else None
+            ),
+        }
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize the puzzle straight to JSON bytes.
+
+        When orjson is installed it serializes the dataclass tree natively
+        (Statement objects go through their to_dict), skipping the
+        intermediate to_dict() allocation; otherwise this falls back to
+        json.dumps over to_dict(). Both paths produce the same shape as
+        to_dict().
+
+        Returns:
+            JSON-encoded puzzle as bytes
+        """
+        if orjson is not None:
+            return orjson.dumps(self, default=_statement_to_dict)
+        return json.dumps(self.to_dict()).encode()
 
     @classmethod
-    def from_dict(cls, data: dict) -> "Puzzle":
+    def from_dict(
+        cls,
+        data: dict,
+        _villager_from_dict=Villager.from_dict,
+        _statement_from_dict=Statement.from_dict,
+    ) -> "Puzzle":
         """Create puzzle from dictionary.
 
+        The two reconstruction callables are pre-bound as defaults so the
+        hot bulk-deserialization path loads them as locals instead of
+        resolving class attributes per call.
+
         Args:
             data: Dictionary with puzzle data
 
         Returns:
             Puzzle instance
         """
-        # Reconstruct villagers
-        villagers = [Villager.from_dict(v_data) for v_data in data["villagers"]]
-        # Reconstruct statements from dictionaries
-        statements_by_speaker = [
-            [Statement.from_dict(stmt_dict) for stmt_dict in bundle]
-            for bundle in data["statements_by_speaker"]
-        ]
-        # Convert lists back to tuples
-        solution_assignment = (
-            tuple(data["solution_assignment"])
-            if data.get("solution_assignment") is not None
-            else None
-        )
-        shill_assignment = (
-            tuple(data["shill_assignment"])
-            if data.get("shill_assignment") is not None
-            else None
-        )
+        solution_assignment = data.get("solution_assignment")
+        shill_assignment = data.get("shill_assignment")
         return cls(
-            villagers=villagers,
-            statements_by_speaker=statements_by_speaker,
+            villagers=[_villager_from_dict(v_data) for v_data in data["villagers"]],
+            statements_by_speaker=[
+                [_statement_from_dict(stmt_dict) for stmt_dict in bundle]
+                for bundle in data["statements_by_speaker"]
+            ],
             difficulty_score=data.get("difficulty_score", 0.0),
-            solution_assignment=solution_assignment,
-            shill_assignment=shill_assignment,
+            solution_assignment=(
+                tuple(solution_assignment) if solution_assignment is not None else None
+            ),
+            shill_assignment=(
+                tuple(shill_assignment) if shill_assignment is not None else None
+            ),
         )
 
 
-@dataclass
+def _statement_to_dict(obj) -> dict:
+    """orjson default hook: serialize Statement objects via to_dict."""
+    return obj.to_dict()
+
+
+@dataclass(slots=True)
 class GenerationConfig:
     """Configuration for puzzle generation."""
 
@@ -158,16 +270,26 @@ class GenerationConfig:
         Returns:
             Dictionary representation of the configuration
         """
-        return asdict(self)
+        # All fields are scalars, so a shallow dict over the cached field
+        # names matches asdict() without its recursive copy machinery.
+        return {name: getattr(self, name) for name in _CONFIG_FIELD_NAMES}
 
     @classmethod
     def from_dict(cls, data: dict) -> "GenerationConfig":
         """Create configuration from dictionary.
 
         Args:
-            data: Dictionary with configuration data
+            data: Dictionary with configuration data. Keys that do not
+                correspond to a config field are ignored, so configs saved
+                by a newer version still load.
 
         Returns:
             GenerationConfig instance
         """
-        return cls(**data)
+        return cls(**{k: v for k, v in data.items() if k in _CONFIG_FIELD_SET})
+
+
+# Field names introspected once at import time; to_dict and from_dict use
+# them on every call instead of re-walking dataclasses.fields().
+_CONFIG_FIELD_NAMES = tuple(f.name for f in fields(GenerationConfig))
+_CONFIG_FIELD_SET = frozenset(_CONFIG_FIELD_NAMES)
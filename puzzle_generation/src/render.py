@@ -5,152 +5,201 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .models import Puzzle
 
+# Constant blocks precomputed at import time so the renderers skip dozens of
+# per-call list.append ops and string re-evaluations. Each block joins into
+# the final output exactly as the equivalent sequence of lines would.
+_BANNER = "=" * 60
+
+_TEXT_HEADER = "\n".join(
+    [
+        _BANNER,
+        "WEREWOLF LOGIC PUZZLE",
+        _BANNER,
+        "",
+        "You arrive at a village with the following villagers:",
+        "",
+    ]
+)
+_TEXT_ROLES_SHILL = "\n".join(
+    [
+        "",
+        "Each villager is either a Human (always tells the truth),",
+        "a Werewolf (at least one thing they say is wrong),",
+        "or a shill (not a werewolf, but at least one thing they say is wrong).",
+        "There is exactly one shill among the non-werewolves.",
+    ]
+)
+_TEXT_ROLES_NO_SHILL = "\n".join(
+    [
+        "",
+        "Each villager is either a Human (always tells the truth)",
+        "or a Werewolf (at least one thing they say is wrong).",
+    ]
+)
+_TEXT_STATEMENTS_INTRO = "\n".join(
+    ["", "The villagers make the following statements:", ""]
+)
+_TEXT_FOOTER = "\n".join([_BANNER, "Can you determine who is a werewolf?", _BANNER])
+
+_MD_HEADER = "\n".join(
+    [
+        "# Werewolf Logic Puzzle",
+        "",
+        "You arrive at a village with the following villagers:",
+        "",
+    ]
+)
+_MD_ROLES_SHILL = "\n".join(
+    [
+        "",
+        "Each villager is either a **honest villager** (always tells the truth),",
+        "a **werewolf* (at least one thing they say is wrong),",
+        "or a **shill** (not a werewolf, but at least one thing they say is wrong).",
+        "There is exactly one shill among the non-werewolves.",
+    ]
+)
+_MD_ROLES_NO_SHILL = "\n".join(
+    [
+        "",
+        "Each villager is either a **honest villager** (always tells the truth)",
+        "or a **werewolf* (at least one thing they say is wrong).",
+    ]
+)
+_MD_STATEMENTS_INTRO = "\n".join(["", "## Statements", ""])
+_MD_FOOTER = "\n".join(["---", "", "**Can you determine who is a werewolf?**"])
+
+
+def _build_speaker_sections(
+    puzzle: "Puzzle",
+) -> tuple[list[str], list[tuple[str, list[str]]]]:
+    """Traverse the puzzle once and render every statement to English.
+
+    Shared by both output formats, so producing text and markdown for the
+    same puzzle pays for the statement traversal only once per format's
+    delimiters, not once per format's traversal logic.
+
+    Args:
+        puzzle: The puzzle whose statements to render
+
+    Returns:
+        Tuple of (villager names, sections), where sections is one
+        (speaker name, English statement lines) pair per speaker with at
+        least one statement
+    """
+    names = [v.name for v in puzzle.villagers]
+    statements_by_speaker = puzzle.statements_by_speaker
+    sections = []
+    for villager in puzzle.villagers:
+        bundle = statements_by_speaker[villager.index]
+        if bundle:
+            sections.append(
+                (villager.name, [statement.to_english(names) for statement in bundle])
+            )
+    return names, sections
 
-class PuzzleRenderer:
-    """Renderer for werewolf puzzles."""
-
-    @staticmethod
-    def render_to_text(puzzle: "Puzzle") -> str:
-        """Render puzzle to plain text format.
-
-        Args:
-            puzzle: The puzzle to render
-
-        Returns:
-            Plain text representation
-        """
-        lines = []
-        lines.append("=" * 60)
-        lines.append("WEREWOLF LOGIC PUZZLE")
-        lines.append("=" * 60)
-        lines.append("")
-        lines.append("You arrive at a village with the following villagers:")
-        lines.append("")
 
-        for villager in puzzle.villagers:
-            lines.append(f"  {villager.index + 1}. {villager.name}")
+def render_to_text(puzzle: "Puzzle") -> str:
+    """Render puzzle to plain text format.
 
-        lines.append("")
-        has_shill = puzzle.shill_assignment is not None
-        if has_shill:
-            lines.append("Each villager is either a Human (always tells the truth),")
-            lines.append("a Werewolf (at least one thing they say is wrong),")
-            lines.append(
-                "or a shill (not a werewolf, but at least one thing they say is wrong)."
-            )
-            lines.append("There is exactly one shill among the non-werewolves.")
-        else:
-            lines.append("Each villager is either a Human (always tells the truth)")
-            lines.append("or a Werewolf (at least one thing they say is wrong).")
-        lines.append("")
-        lines.append("The villagers make the following statements:")
-        lines.append("")
+    Args:
+        puzzle: The puzzle to render
 
-        for villager in puzzle.villagers:
-            statements = puzzle.statements_by_speaker[villager.index]
-            if not statements:
-                continue
+    Returns:
+        Plain text representation
+    """
+    lines = [_TEXT_HEADER]
 
-            lines.append(f"{villager.name} says:")
-            names = [v.name for v in puzzle.villagers]
-            for i, statement in enumerate(statements, 1):
-                lines.append(f"  {i}. {statement.to_english(names)}")
-            lines.append("")
+    lines.append(
+        "\n".join(f"  {v.index + 1}. {v.name}" for v in puzzle.villagers)
+    )
 
-        lines.append("=" * 60)
-        lines.append("Can you determine who is a werewolf?")
-        lines.append("=" * 60)
+    has_shill = puzzle.shill_assignment is not None
+    lines.append(_TEXT_ROLES_SHILL if has_shill else _TEXT_ROLES_NO_SHILL)
+    lines.append(_TEXT_STATEMENTS_INTRO)
 
-        return "\n".join(lines)
+    # All English renderings computed up front in one shared traversal
+    _, sections = _build_speaker_sections(puzzle)
 
-    @staticmethod
-    def render_to_markdown(puzzle: "Puzzle") -> str:
-        """Render puzzle to markdown format.
+    for speaker_name, statement_lines in sections:
+        # One pre-joined block per speaker: name line, statements and
+        # the trailing blank line in a single append
+        numbered = "\n".join(
+            f"  {i}. {text}" for i, text in enumerate(statement_lines, 1)
+        )
+        lines.append(f"{speaker_name} says:\n{numbered}\n")
 
-        Args:
-            puzzle: The puzzle to render
+    lines.append(_TEXT_FOOTER)
 
-        Returns:
-            Markdown representation
-        """
-        lines = []
-        lines.append("# Werewolf Logic Puzzle")
-        lines.append("")
-        lines.append("You arrive at a village with the following villagers:")
-        lines.append("")
+    return "\n".join(lines)
 
-        for villager in puzzle.villagers:
-            lines.append(f"- **{villager.name}**")
 
-        lines.append("")
-        has_shill = puzzle.shill_assignment is not None
-        if has_shill:
-            lines.append(
-                "Each villager is either a **honest villager** (always tells the truth),"
-            )
-            lines.append("a **werewolf* (at least one thing they say is wrong),")
-            lines.append(
-                "or a **shill** (not a werewolf, but at least one thing they say is wrong)."
-            )
-            lines.append("There is exactly one shill among the non-werewolves.")
+def render_to_markdown(puzzle: "Puzzle") -> str:
+    """Render puzzle to markdown format.
+
+    Args:
+        puzzle: The puzzle to render
+
+    Returns:
+        Markdown representation
+    """
+    lines = [_MD_HEADER]
+
+    lines.append("\n".join(f"- **{v.name}**" for v in puzzle.villagers))
+
+    has_shill = puzzle.shill_assignment is not None
+    lines.append(_MD_ROLES_SHILL if has_shill else _MD_ROLES_NO_SHILL)
+    lines.append(_MD_STATEMENTS_INTRO)
+
+    # All English renderings computed up front in one shared traversal
+    names, sections = _build_speaker_sections(puzzle)
+
+    for speaker_name, statement_lines in sections:
+        if len(statement_lines) == 1:
+            # Single statement: use quote format
+            body = f"> {statement_lines[0]}"
         else:
-            lines.append(
-                "Each villager is either a **honest villager** (always tells the truth)"
+            # Multiple statements: use numbered list
+            body = "\n".join(
+                f"{i}. {text}" for i, text in enumerate(statement_lines, 1)
             )
-            lines.append("or a **werewolf* (at least one thing they say is wrong).")
-        lines.append("")
-        lines.append("## Statements")
-        lines.append("")
+        # One pre-joined block per speaker: heading, statements and the
+        # trailing blank line in a single append
+        lines.append(f"### {speaker_name}\n\n{body}\n")
 
-        for villager in puzzle.villagers:
-            statements = puzzle.statements_by_speaker[villager.index]
-            if not statements:
-                continue
-
-            lines.append(f"### {villager.name}")
-            lines.append("")
-            names = [v.name for v in puzzle.villagers]
-            if len(statements) == 1:
-                # Single statement: use quote format
-                lines.append(f"> {statements[0].to_english(names)}")
-            else:
-                # Multiple statements: use numbered list
-                for i, statement in enumerate(statements, 1):
-                    lines.append(f"{i}. {statement.to_english(names)}")
-            lines.append("")
+    lines.append(_MD_FOOTER)
 
+    if puzzle.solution_assignment:
+        lines.append("")
         lines.append("---")
         lines.append("")
-        lines.append("**Can you determine who is a werewolf?**")
-
-        if puzzle.solution_assignment:
-            lines.append("")
-            lines.append("---")
-            lines.append("")
-            lines.append("## Solution")
-            lines.append("")
-            werewolves = [
-                puzzle.villagers[i].name
-                for i, is_wolf in enumerate(puzzle.solution_assignment)
-                if is_wolf
-            ]
-            if werewolves:
-                lines.append("The werewolves are:")
-                for name in werewolves:
-                    lines.append(f"- {name}")
-            else:
-                lines.append("There are no werewolves - all villagers are human!")
-
-            if puzzle.shill_assignment:
-                shills = [
-                    puzzle.villagers[i].name
-                    for i, is_shill in enumerate(puzzle.shill_assignment)
-                    if is_shill
-                ]
-                if shills:
-                    lines.append("")
-                    lines.append("The shill is:")
-                    for name in shills:
-                        lines.append(f"- {name}")
-
-        return "\n".join(lines)
+        lines.append("## Solution")
+        lines.append("")
+        # Index tuples are cached on the puzzle, so rendering both
+        # formats scans each assignment only once
+        werewolves = [names[i] for i in puzzle.werewolf_indices()]
+        if werewolves:
+            lines.append("The werewolves are:")
+            lines.append("\n".join(f"- {name}" for name in werewolves))
+        else:
+            lines.append("There are no werewolves - all villagers are human!")
+
+        if puzzle.shill_assignment:
+            shills = [names[i] for i in puzzle.shill_indices()]
+            if shills:
+                lines.append("")
+                lines.append("The shill is:")
+                lines.append("\n".join(f"- {name}" for name in shills))
+
+    return "\n".join(lines)
+
+
+class PuzzleRenderer:
+    """Renderer for werewolf puzzles.
+
+    Thin namespace kept for API compatibility; the module-level
+    render_to_text / render_to_markdown functions do the work and skip
+    the per-call staticmethod descriptor lookup for internal callers.
+    """
+
+    render_to_text = staticmethod(render_to_text)
+    render_to_markdown = staticmethod(render_to_markdown)
@@ -1,6 +1,7 @@
 """Z3-based solver for puzzle verification and uniqueness checking."""
 
 import z3
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -8,6 +9,23 @@ if TYPE_CHECKING:
     from .truth_cache import StatementTruthTableCache
 
 
+@lru_cache(maxsize=None)
+def _werewolf_vars(N: int) -> list:
+    """Return the shared list of W[i] Z3 Bool variables for a given N.
+
+    z3.Bool interns by name, so the variables are the same ASTs either way;
+    sharing the list object keeps its identity stable across solver builds,
+    which lets Statement.to_solver_expr's per-W_vars cache hit.
+    """
+    return [z3.Bool(f"W{i}") for i in range(N)]
+
+
+@lru_cache(maxsize=None)
+def _shill_vars(N: int) -> list:
+    """Return the shared list of M[i] Z3 Bool variables for a given N."""
+    return [z3.Bool(f"M{i}") for i in range(N)]
+
+
 class PuzzleSolver:
     """Solver for werewolf puzzles using Z3."""
 
@@ -25,12 +43,12 @@ class PuzzleSolver:
         N = len(puzzle.villagers)
 
         # Create boolean variables for each villager
-        W_vars = [z3.Bool(f"W{i}") for i in range(N)]
+        W_vars = _werewolf_vars(N)
 
         # Create boolean variables for shills if shill_assignment is provided
         M_vars = None
         if puzzle.shill_assignment is not None:
-            M_vars = [z3.Bool(f"M{i}") for i in range(N)]
+            M_vars = _shill_vars(N)
 
             # Constraint: exactly one shill
             solver.add(sum(z3.If(M_vars[i], 1, 0) for i in range(N)) == 1)
@@ -86,7 +104,7 @@ class PuzzleSolver:
 
         model = solver.model()
         N = len(puzzle.villagers)
-        W_vars = [z3.Bool(f"W{i}") for i in range(N)]
+        W_vars = _werewolf_vars(N)
 
         assignment = tuple(z3.is_true(model[W_vars[i]]) for i in range(N))
 
@@ -111,12 +129,12 @@ class PuzzleSolver:
 
         model = solver.model()
         N = len(puzzle.villagers)
-        W_vars = [z3.Bool(f"W{i}") for i in range(N)]
+        W_vars = _werewolf_vars(N)
 
         werewolf_assignment = tuple(z3.is_true(model[W_vars[i]]) for i in range(N))
 
         if puzzle.shill_assignment is not None:
-            M_vars = [z3.Bool(f"M{i}") for i in range(N)]
+            M_vars = _shill_vars(N)
             shill_assignment = tuple(z3.is_true(model[M_vars[i]]) for i in range(N))
         else:
             shill_assignment = tuple(False for _ in range(N))
@@ -160,7 +178,7 @@ class PuzzleSolver:
         # Get first solution
         model = solver.model()
         N = len(puzzle.villagers)
-        W_vars = [z3.Bool(f"W{i}") for i in range(N)]
+        W_vars = _werewolf_vars(N)
 
         # Build blocking constraint: assignment != found_model
         # Need to block both werewolf and shill assignments if shills are enabled
@@ -173,7 +191,7 @@ class PuzzleSolver:
 
         # If shills are enabled, also block shill assignment
         if puzzle.shill_assignment is not None:
-            M_vars = [z3.Bool(f"M{i}") for i in range(N)]
+            M_vars = _shill_vars(N)
             for i in range(N):
                 if z3.is_true(model[M_vars[i]]):
                     blocking_constraints.append(z3.Not(M_vars[i]))
@@ -202,7 +220,7 @@ class PuzzleSolver:
         solutions = []
         solver = PuzzleSolver.build_solver(puzzle)
         N = len(puzzle.villagers)
-        W_vars = [z3.Bool(f"W{i}") for i in range(N)]
+        W_vars = _werewolf_vars(N)
 
         while len(solutions) < max_solutions:
             if solver.check() != z3.sat:
@@ -292,26 +310,20 @@ class PuzzleSolver:
                 bundle_all_true_mask &= truth_mask
 
             # Speaker compatibility: AND(statements) == NOT(W[speaker]) AND NOT(M[speaker])
+            # (lying speakers are wolves, plus shills when enabled; the AND
+            # with the non-negative lying mask clips ~bundle_all_true_mask to
+            # the 2^N assignment bits)
+            lying_mask = wolf_mask_by_speaker[speaker_idx]
             if shill_mask_by_speaker is not None:
-                shill_mask = shill_mask_by_speaker[speaker_idx]
-                compat_mask = (
-                    human_mask_by_speaker[speaker_idx] & bundle_all_true_mask
-                ) | (
-                    (wolf_mask_by_speaker[speaker_idx] | shill_mask)
-                    & (all_assignments_mask & (~bundle_all_true_mask))
-                )
-            else:
-                compat_mask = (
-                    human_mask_by_speaker[speaker_idx] & bundle_all_true_mask
-                ) | (
-                    wolf_mask_by_speaker[speaker_idx]
-                    & (all_assignments_mask & (~bundle_all_true_mask))
-                )
+                lying_mask |= shill_mask_by_speaker[speaker_idx]
+            compat_mask = (
+                human_mask_by_speaker[speaker_idx] & bundle_all_true_mask
+            ) | (lying_mask & ~bundle_all_true_mask)
 
             # Update remaining mask
-            assignments_before = bin(remaining_mask).count("1")
+            assignments_before = remaining_mask.bit_count()
             remaining_mask &= compat_mask
-            assignments_after = bin(remaining_mask).count("1")
+            assignments_after = remaining_mask.bit_count()
 
             if assignments_before > 0:
                 reduction = assignments_before - assignments_after
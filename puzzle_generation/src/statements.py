@@ -1,17 +1,32 @@
 """Statement classes representing boolean statements about werewolves."""
 
+import sys
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
+from weakref import WeakValueDictionary
 
 import z3
 
 if TYPE_CHECKING:
     from z3 import BoolRef
 
+# Shared empty pair set for statements with no accusations/vouchings
+_NO_PAIRS: frozenset[tuple[int, int]] = frozenset()
+
 
 class Statement(ABC):
     """Abstract base class for all statements."""
 
+    # Slotted hierarchy: statements are allocated in bulk when building
+    # libraries and datasets, so dropping per-instance __dict__ shrinks
+    # them substantially. __weakref__ is required for the flyweight pools.
+    __slots__ = (
+        "__weakref__",
+        "_hash",
+        "_solver_expr_cache",
+        "_solver_expr_keepalive",
+    )
+
     @property
     @abstractmethod
     def statement_id(self) -> str:
@@ -19,8 +34,22 @@ class Statement(ABC):
         pass
 
     @abstractmethod
-    def variables_involved(self) -> set[int]:
-        """Return the set of villager indices referenced by this statement."""
+    def variables_involved(self) -> frozenset[int]:
+        """Return the set of villager indices referenced by this statement.
+
+        The returned frozenset is a shared per-instance constant; callers
+        must not rely on mutating it (none do).
+        """
+        pass
+
+    @abstractmethod
+    def variables_involved_mask(self) -> int:
+        """Return the referenced villager indices packed as an int bitmask.
+
+        Bit i is set if villager i appears in this statement. Overlap and
+        self-reference checks can use bitwise ops on the mask instead of
+        set operations.
+        """
         pass
 
     @abstractmethod
@@ -36,9 +65,49 @@ class Statement(ABC):
         pass
 
     @abstractmethod
+    def evaluate_on_mask(self, W: int) -> bool:
+        """Evaluate this statement on an assignment packed as a bitmask.
+
+        This is the hot-path form: bit i of W is assignment[i], matching the
+        index convention of the truth-table cache, so evaluation is a couple
+        of bitwise ops against masks precomputed at construction instead of
+        per-element tuple indexing.
+
+        Args:
+            W: Integer bitmask where bit i is set if villager i is a werewolf
+
+        Returns:
+            True if the statement is satisfied by this assignment, False otherwise
+        """
+        pass
+
     def to_solver_expr(self, W_vars: list) -> "BoolRef":
         """Convert this statement to a Z3 boolean expression.
 
+        The built expression is cached per W_vars list identity: the solver
+        reuses one variable list per N, so re-encoding the same statement
+        across repeated solver builds returns the cached BoolRef instead of
+        reconstructing it. The keepalive list pins cached W_vars lists so
+        their ids stay unique.
+
+        Args:
+            W_vars: List of Z3 Bool variables, where W_vars[i] represents W[i]
+
+        Returns:
+            A Z3 BoolRef representing this statement
+        """
+        key = id(W_vars)
+        expr = self._solver_expr_cache.get(key)
+        if expr is None:
+            expr = self._build_solver_expr(W_vars)
+            self._solver_expr_cache[key] = expr
+            self._solver_expr_keepalive.append(W_vars)
+        return expr
+
+    @abstractmethod
+    def _build_solver_expr(self, W_vars: list) -> "BoolRef":
+        """Build the Z3 boolean expression for this statement (uncached).
+
         Args:
             W_vars: List of Z3 Bool variables, where W_vars[i] represents W[i]
 
@@ -86,7 +155,7 @@ class Statement(ABC):
         pass
 
     @abstractmethod
-    def get_accusations(self) -> set[tuple[int, int]]:
+    def get_accusations(self) -> frozenset[tuple[int, int]]:
         """Return set of (accuser, accused) tuples implied by this statement.
 
         An accusation (a, b) means the statement implies a negative relationship
@@ -98,7 +167,7 @@ class Statement(ABC):
         pass
 
     @abstractmethod
-    def get_vouchings(self) -> set[tuple[int, int]]:
+    def get_vouchings(self) -> frozenset[tuple[int, int]]:
         """Return set of (voucher, vouched_for) tuples implied by this statement.
 
         A vouching (a, b) means the statement implies a positive relationship
@@ -126,44 +195,29 @@ class Statement(ABC):
         if stmt_type is None:
             raise ValueError("Statement dict must include 'type' field")
 
-        if stmt_type == "IfAThenB":
-            return IfAThenB(data["a_index"], data["b_index"])
-        elif stmt_type == "BothOrNeither":
-            return BothOrNeither(data["a_index"], data["b_index"])
-        elif stmt_type == "AtLeastOne":
-            return AtLeastOne(data["a_index"], data["b_index"])
-        elif stmt_type == "ExactlyOne":
-            return ExactlyOne(data["a_index"], data["b_index"])
-        elif stmt_type == "AtMostOne":
-            return AtMostOne(data["a_index"], data["b_index"])
-        elif stmt_type == "IfNotAThenB":
-            return IfNotAThenB(data["a_index"], data["b_index"])
-        elif stmt_type == "Neither":
-            return Neither(data["a_index"], data["b_index"])
-        # New unified CountWerewolves type
-        elif stmt_type == "CountWerewolves":
+        # One dict lookup per parse instead of walking an if/elif chain;
+        # this path runs once per statement when loading puzzle datasets.
+        relationship_cls = _RELATIONSHIP_TYPE_DISPATCH.get(stmt_type)
+        if relationship_cls is not None:
+            return relationship_cls(data["a_index"], data["b_index"])
+
+        # Unified CountWerewolves type
+        if stmt_type == "CountWerewolves":
             scope = tuple(data["scope_indices"])
             count = data["count"]
             comparison = data.get("comparison", "exactly")
             return CountWerewolves(scope, count, comparison)
+
         # Legacy count statement types (backwards compatibility)
-        elif stmt_type == "ExactlyKWerewolves":
-            scope = tuple(data["scope_indices"])
-            return CountWerewolves(scope, data["count"], "exactly")
-        elif stmt_type == "AtMostKWerewolves":
-            scope = tuple(data["scope_indices"])
-            return CountWerewolves(scope, data["count"], "at_most")
-        elif stmt_type == "AtLeastKWerewolves":
-            scope = tuple(data["scope_indices"])
-            return CountWerewolves(scope, data["count"], "at_least")
-        elif stmt_type == "EvenNumberOfWerewolves":
+        legacy = _LEGACY_COUNT_TYPE_DISPATCH.get(stmt_type)
+        if legacy is not None:
             scope = tuple(data["scope_indices"])
-            return CountWerewolves(scope, "even")
-        elif stmt_type == "OddNumberOfWerewolves":
-            scope = tuple(data["scope_indices"])
-            return CountWerewolves(scope, "odd")
-        else:
-            raise ValueError(f"Unknown statement type: {stmt_type}")
+            count, comparison = legacy
+            if count is None:
+                return CountWerewolves(scope, data["count"], comparison)
+            return CountWerewolves(scope, count)
+
+        raise ValueError(f"Unknown statement type: {stmt_type}")
 
     @classmethod
     def from_short_string(cls, short_str: str) -> "Statement":
@@ -178,85 +232,57 @@ class Statement(ABC):
         Raises:
             ValueError: If the short string format is invalid
         """
-        parts = short_str.split("-")
-        if len(parts) < 2:
+        # Parsed with str.partition instead of split: no intermediate parts
+        # list, and each segment is cut exactly once. Trailing "-" checks
+        # preserve the old "wrong number of segments" errors.
+        code, sep, rest = short_str.partition("-")
+        if not sep:
             raise ValueError(f"Invalid short string format: {short_str}")
 
-        code = parts[0]
-
-        # Relationship statements: code-a-b
-        if code == "I":  # IfAThenB
-            if len(parts) != 3:
-                raise ValueError(f"Invalid IfAThenB format: {short_str}")
-            return IfAThenB(int(parts[1]), int(parts[2]))
-        elif code == "B":  # BothOrNeither
-            if len(parts) != 3:
-                raise ValueError(f"Invalid BothOrNeither format: {short_str}")
-            return BothOrNeither(int(parts[1]), int(parts[2]))
-        elif code == "A":  # AtLeastOne
-            if len(parts) != 3:
-                raise ValueError(f"Invalid AtLeastOne format: {short_str}")
-            return AtLeastOne(int(parts[1]), int(parts[2]))
-        elif code == "X":  # ExactlyOne
-            if len(parts) != 3:
-                raise ValueError(f"Invalid ExactlyOne format: {short_str}")
-            return ExactlyOne(int(parts[1]), int(parts[2]))
-        elif code == "F":  # IfNotAThenB
-            if len(parts) != 3:
-                raise ValueError(f"Invalid IfNotAThenB format: {short_str}")
-            return IfNotAThenB(int(parts[1]), int(parts[2]))
-        elif code == "T":  # AtMostOne
-            if len(parts) != 3:
-                raise ValueError(f"Invalid AtMostOne format: {short_str}")
-            return AtMostOne(int(parts[1]), int(parts[2]))
-        elif code == "N":  # Neither
-            if len(parts) != 3:
-                raise ValueError(f"Invalid Neither format: {short_str}")
-            return Neither(int(parts[1]), int(parts[2]))
-        # Count statements (all return CountWerewolves)
-        elif code == "E":  # ExactlyKWerewolves: E-scope-count (scope uses dots)
-            if len(parts) != 3:
+        # Relationship statements: code-a-b (one dict lookup per parse)
+        relationship_cls = _SHORT_RELATIONSHIP_DISPATCH.get(code)
+        if relationship_cls is not None:
+            a_str, sep2, b_str = rest.partition("-")
+            if not sep2 or "-" in b_str:
                 raise ValueError(
-                    f"Invalid CountWerewolves (exactly) format: {short_str}"
+                    f"Invalid {relationship_cls.__name__} format: {short_str}"
                 )
-            scope = tuple(int(x) for x in parts[1].split("."))
-            count = int(parts[2])
-            return CountWerewolves(scope, count, "exactly")
-        elif code == "M":  # AtMostKWerewolves: M-scope-count (scope uses dots)
-            if len(parts) != 3:
-                raise ValueError(
-                    f"Invalid CountWerewolves (at_most) format: {short_str}"
-                )
-            scope = tuple(int(x) for x in parts[1].split("."))
-            count = int(parts[2])
-            return CountWerewolves(scope, count, "at_most")
-        elif code == "L":  # AtLeastKWerewolves: L-scope-count (scope uses dots)
-            if len(parts) != 3:
+            return relationship_cls(int(a_str), int(b_str))
+
+        # Count statements (all return CountWerewolves; scope uses dots)
+        kind = _SHORT_COUNT_DISPATCH.get(code)
+        if kind is None:
+            raise ValueError(f"Unknown statement code: {code}")
+
+        if kind == "even" or kind == "odd":  # V-scope / O-scope
+            if "-" in rest:
                 raise ValueError(
-                    f"Invalid CountWerewolves (at_least) format: {short_str}"
+                    f"Invalid CountWerewolves ({kind}) format: {short_str}"
                 )
-            scope = tuple(int(x) for x in parts[1].split("."))
-            count = int(parts[2])
-            return CountWerewolves(scope, count, "at_least")
-        elif code == "V":  # EvenNumberOfWerewolves: V-scope (scope uses dots)
-            if len(parts) != 2:
-                raise ValueError(f"Invalid CountWerewolves (even) format: {short_str}")
-            scope = tuple(int(x) for x in parts[1].split("."))
-            return CountWerewolves(scope, "even")
-        elif code == "O":  # OddNumberOfWerewolves: O-scope (scope uses dots)
-            if len(parts) != 2:
-                raise ValueError(f"Invalid CountWerewolves (odd) format: {short_str}")
-            scope = tuple(int(x) for x in parts[1].split("."))
-            return CountWerewolves(scope, "odd")
-        else:
-            raise ValueError(f"Unknown statement code: {code}")
+            scope = tuple(map(int, rest.split(".")))
+            return CountWerewolves(scope, kind)
+
+        # E/M/L: code-scope-count
+        scope_str, sep2, count_str = rest.partition("-")
+        if not sep2 or "-" in count_str:
+            raise ValueError(f"Invalid CountWerewolves ({kind}) format: {short_str}")
+        scope = tuple(map(int, scope_str.split(".")))
+        return CountWerewolves(scope, int(count_str), kind)
 
     def __hash__(self) -> int:
-        """Hash based on statement_id for use in sets/dicts."""
-        return hash(self.statement_id)
+        """Hash based on statement_id, precomputed at construction."""
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
-        """Equality based on statement_id."""
+        """Equality based on statement_id, with an identity fast path.
+
+        Interning means value-equal constructions usually yield the same
+        object, so most comparisons resolve on the pointer check. The
+        statement_id fallback keeps logically equal statements that are
+        distinct objects (e.g. reordered count scopes) comparing equal.
+        """
+        if self is other:
+            return True
         if not isinstance(other, Statement):
             return False
         return self.statement_id == other.statement_id
@@ -265,6 +291,45 @@ class Statement(ABC):
 class RelationshipStatement(Statement):
     """Base class for statements involving two villagers."""
 
+    __slots__ = (
+        "a_index",
+        "b_index",
+        "_variables_involved",
+        "_a_mask",
+        "_b_mask",
+        "_variables_mask",
+        "_statement_id",
+        "_short_string",
+        "_accusations",
+        "_vouchings",
+    )
+
+    # Flyweight pool shared by all relationship classes: the generator
+    # constructs the same (class, a, b) combinations over and over across
+    # attempts, so construction returns one interned instance per
+    # combination. Weak values let unused entries be collected. Equality
+    # and hashing are unchanged (still statement_id based); interning
+    # makes the common case a pointer compare and preserves per-instance
+    # caches (truth masks, solver expressions) across reconstructions.
+    _intern: "WeakValueDictionary[tuple, RelationshipStatement]" = (
+        WeakValueDictionary()
+    )
+
+    # Subclasses whose semantics are symmetric in (a, b) set this so
+    # __new__ normalizes before the pool lookup, matching the min/max
+    # normalization their __init__ applies.
+    _symmetric = False
+
+    def __new__(cls, a_index: int, b_index: int):
+        if cls._symmetric and b_index < a_index:
+            a_index, b_index = b_index, a_index
+        key = (cls, a_index, b_index)
+        inst = cls._intern.get(key)
+        if inst is None:
+            inst = super().__new__(cls)
+            cls._intern[key] = inst
+        return inst
+
     def __init__(self, a_index: int, b_index: int):
         """Initialize a relationship statement.
 
@@ -272,12 +337,93 @@ class RelationshipStatement(Statement):
             a_index: Index of first villager
             b_index: Index of second villager
         """
+        if getattr(self, "_a_mask", None) is not None:
+            # Interned instance returned by __new__; already initialized,
+            # and re-running would clobber the solver expression cache.
+            return
+        if self._symmetric and b_index < a_index:
+            # Same conditional swap __new__ applies for the pool key;
+            # __init__ receives the original arguments, so it normalizes
+            # again here instead of via per-subclass min/max constructors
+            a_index, b_index = b_index, a_index
         self.a_index = a_index
         self.b_index = b_index
+        # Computed once: speaker filtering queries this for every statement
+        # in the library, for every speaker
+        self._variables_involved = frozenset((a_index, b_index))
+        # Single-bit masks for evaluate_on_mask, plus their union for
+        # variables_involved_mask
+        self._a_mask = 1 << a_index
+        self._b_mask = 1 << b_index
+        self._variables_mask = self._a_mask | self._b_mask
+        # Per-W_vars-identity cache of built Z3 expressions (see
+        # Statement.to_solver_expr)
+        self._solver_expr_cache: dict[int, "BoolRef"] = {}
+        self._solver_expr_keepalive: list[list] = []
+        # Identifier strings are fixed once (a, b) are set; formatting them
+        # here makes hash/eq and short-string serialization attribute loads
+        # instead of per-call f-string work. _ID_PREFIX and _SHORT_CODE are
+        # class attributes on each concrete subclass. Interned so dict
+        # lookups keyed on ids (e.g. the truth-table cache) and the __eq__
+        # fallback usually resolve on pointer equality, as Villager names do.
+        self._statement_id = sys.intern(f"{self._ID_PREFIX}({a_index},{b_index})")
+        self._short_string = sys.intern(f"{self._SHORT_CODE}-{a_index}-{b_index}")
+        self._hash = hash(self._statement_id)
+        # Accusation/vouching pair sets are fixed once (a, b) are set;
+        # built once via the subclass rules so the accusation-graph phase
+        # reads shared frozensets instead of allocating set literals.
+        self._accusations = frozenset(self._build_accusations())
+        self._vouchings = frozenset(self._build_vouchings())
+
+    @property
+    def statement_id(self) -> str:
+        """Return the precomputed canonical identifier."""
+        return self._statement_id
+
+    def get_accusations(self) -> frozenset[tuple[int, int]]:
+        """Return the precomputed accusation pairs."""
+        return self._accusations
+
+    def get_vouchings(self) -> frozenset[tuple[int, int]]:
+        """Return the precomputed vouching pairs."""
+        return self._vouchings
 
-    def variables_involved(self) -> set[int]:
+    def to_english(self, names: list[str]) -> str:
+        """Convert this statement to English using the class template.
+
+        _ENGLISH_TEMPLATE is a class attribute with {a}/{b} placeholders
+        for the two villager names.
+        """
+        return self._ENGLISH_TEMPLATE.format(
+            a=names[self.a_index], b=names[self.b_index]
+        )
+
+    def __reduce__(self):
+        """Pickle/copy support: rebuild through the interning constructor.
+
+        The flyweight __new__ takes required arguments, so the default
+        slotted-object reduction would fail; reducing to the constructor
+        call also re-interns on load and keeps pickles compact.
+        """
+        return (self.__class__, (self.a_index, self.b_index))
+
+    @abstractmethod
+    def _build_accusations(self) -> set[tuple[int, int]]:
+        """Build the accusation pairs for this statement (called once)."""
+        pass
+
+    @abstractmethod
+    def _build_vouchings(self) -> set[tuple[int, int]]:
+        """Build the vouching pairs for this statement (called once)."""
+        pass
+
+    def variables_involved(self) -> frozenset[int]:
         """Return the set of villager indices referenced."""
-        return {self.a_index, self.b_index}
+        return self._variables_involved
+
+    def variables_involved_mask(self) -> int:
+        """Return the referenced villager indices as an int bitmask."""
+        return self._variables_mask
 
     def to_dict(self) -> dict:
         """Convert relationship statement to dictionary.
@@ -291,30 +437,52 @@ class RelationshipStatement(Statement):
             "b_index": self.b_index,
         }
 
-    @abstractmethod
     def to_short_string(self) -> str:
-        """Return a short string representation of this relationship statement.
+        """Return the precomputed short string representation.
 
         Returns:
             Short string like "I-5-7" for IfAThenB(5,7)
         """
-        pass
+        return self._short_string
 
 
 class CountStatement(Statement):
     """Base class for statements about counts of werewolves."""
 
+    __slots__ = ("scope_indices", "_variables_involved", "_scope_mask")
+
     def __init__(self, scope_indices: tuple[int, ...]):
         """Initialize a count statement.
 
         Args:
             scope_indices: Tuple of villager indices in the scope
         """
+        if getattr(self, "_scope_mask", None) is not None:
+            # Interned instance returned by __new__; already initialized,
+            # and re-running would clobber the solver expression cache.
+            return
         self.scope_indices = scope_indices
-
-    def variables_involved(self) -> set[int]:
+        # Computed once: speaker filtering queries this for every statement
+        # in the library, for every speaker
+        self._variables_involved = frozenset(scope_indices)
+        # Scope as a bitmask: evaluate_on_mask counts werewolves in scope
+        # with one AND plus a popcount
+        scope_mask = 0
+        for i in scope_indices:
+            scope_mask |= 1 << i
+        self._scope_mask = scope_mask
+        # Per-W_vars-identity cache of built Z3 expressions (see
+        # Statement.to_solver_expr)
+        self._solver_expr_cache: dict[int, "BoolRef"] = {}
+        self._solver_expr_keepalive: list[list] = []
+
+    def variables_involved(self) -> frozenset[int]:
         """Return the set of villager indices referenced."""
-        return set(self.scope_indices)
+        return self._variables_involved
+
+    def variables_involved_mask(self) -> int:
+        """Return the referenced villager indices as an int bitmask."""
+        return self._scope_mask
 
     def to_dict(self) -> dict:
         """Convert count statement to dictionary.
@@ -328,14 +496,18 @@ class CountStatement(Statement):
             "scope_indices": list(self.scope_indices),  # Convert tuple to list for JSON
         }
 
-    @abstractmethod
+    @property
+    def statement_id(self) -> str:
+        """Return the precomputed canonical identifier."""
+        return self._statement_id
+
     def to_short_string(self) -> str:
-        """Return a short string representation of this count statement.
+        """Return the precomputed short string representation.
 
         Returns:
-            Short string like "E-0,1,2-2" for ExactlyKWerewolves((0,1,2), 2)
+            Short string like "E-0.1.2-2" for CountWerewolves((0,1,2), 2)
         """
-        pass
+        return self._short_string
 
 
 # Relationship Statement Subclasses
@@ -344,33 +516,31 @@ class CountStatement(Statement):
 class IfAThenB(RelationshipStatement):
     """Semantics: W[a] => W[b]"""
 
-    @property
-    def statement_id(self) -> str:
-        return f"IMP({self.a_index},{self.b_index})"
+    __slots__ = ()
+
+    _ID_PREFIX = "IMP"
+    _SHORT_CODE = "I"
+    _ENGLISH_TEMPLATE = "If {a} is a werewolf, then {b} is a werewolf."
 
     def evaluate_on_assignment(self, assignment: tuple[bool, ...]) -> bool:
         # W[a] => W[b] is equivalent to NOT W[a] OR W[b]
         return not assignment[self.a_index] or assignment[self.b_index]
 
-    def to_solver_expr(self, W_vars: list) -> "BoolRef":
+    def evaluate_on_mask(self, W: int) -> bool:
+        return not (W & self._a_mask) or bool(W & self._b_mask)
+
+    def _build_solver_expr(self, W_vars: list) -> "BoolRef":
         # W[a] => W[b]
         return z3.Implies(W_vars[self.a_index], W_vars[self.b_index])
 
-    def to_english(self, names: list[str]) -> str:
-        return f"If {names[self.a_index]} is a werewolf, then {names[self.b_index]} is a werewolf."
-
     def complexity_cost(self) -> int:
         return 1
 
-    def to_short_string(self) -> str:
-        """Return short string representation: I-a-b"""
-        return f"I-{self.a_index}-{self.b_index}"
-
-    def get_accusations(self) -> set[tuple[int, int]]:
+    def _build_accusations(self) -> set[tuple[int, int]]:
         """a's guilt implies b's guilt - accusation from a to b."""
         return {(self.a_index, self.b_index)}
 
-    def get_vouchings(self) -> set[tuple[int, int]]:
+    def _build_vouchings(self) -> set[tuple[int, int]]:
         """Contrapositive: b's innocence implies a's innocence - b vouches for a."""
         return {(self.b_index, self.a_index)}
 
@@ -378,37 +548,32 @@ class IfAThenB(RelationshipStatement):
 class BothOrNeither(RelationshipStatement):
     """Semantics: W[a] == W[b]"""
 
-    def __init__(self, a_index: int, b_index: int):
-        """Initialize a BothOrNeither statement, normalizing indices for symmetry."""
-        # Normalize: always store min(a, b) as a_index, max(a, b) as b_index
-        super().__init__(min(a_index, b_index), max(a_index, b_index))
+    __slots__ = ()
 
-    @property
-    def statement_id(self) -> str:
-        return f"EQ({self.a_index},{self.b_index})"
+    _symmetric = True
+
+    _ID_PREFIX = "EQ"
+    _SHORT_CODE = "B"
+    _ENGLISH_TEMPLATE = "{a} and {b} are both werewolves, or neither is."
 
     def evaluate_on_assignment(self, assignment: tuple[bool, ...]) -> bool:
         return assignment[self.a_index] == assignment[self.b_index]
 
-    def to_solver_expr(self, W_vars: list) -> "BoolRef":
+    def evaluate_on_mask(self, W: int) -> bool:
+        return bool(W & self._a_mask) == bool(W & self._b_mask)
+
+    def _build_solver_expr(self, W_vars: list) -> "BoolRef":
         # W[a] == W[b]
         return W_vars[self.a_index] == W_vars[self.b_index]
 
-    def to_english(self, names: list[str]) -> str:
-        return f"{names[self.a_index]} and {names[self.b_index]} are both werewolves, or neither is."
-
     def complexity_cost(self) -> int:
         return 1
 
-    def to_short_string(self) -> str:
-        """Return short string representation: B-a-b"""
-        return f"B-{self.a_index}-{self.b_index}"
-
-    def get_accusations(self) -> set[tuple[int, int]]:
+    def _build_accusations(self) -> set[tuple[int, int]]:
         """No accusations - this is a mutual vouching relationship."""
         return set()
 
-    def get_vouchings(self) -> set[tuple[int, int]]:
+    def _build_vouchings(self) -> set[tuple[int, int]]:
         """Mutual vouching - they share the same fate."""
         return {(self.a_index, self.b_index), (self.b_index, self.a_index)}
 
@@ -416,37 +581,32 @@ class BothOrNeither(RelationshipStatement):
 class AtLeastOne(RelationshipStatement):
     """Semantics: W[a] OR W[b]"""
 
-    def __init__(self, a_index: int, b_index: int):
-        """Initialize an AtLeastOne statement, normalizing indices for symmetry."""
-        # Normalize: always store min(a, b) as a_index, max(a, b) as b_index
-        super().__init__(min(a_index, b_index), max(a_index, b_index))
+    __slots__ = ()
 
-    @property
-    def statement_id(self) -> str:
-        return f"OR({self.a_index},{self.b_index})"
+    _symmetric = True
+
+    _ID_PREFIX = "OR"
+    _SHORT_CODE = "A"
+    _ENGLISH_TEMPLATE = "At least one of {a} and {b} is a werewolf."
 
     def evaluate_on_assignment(self, assignment: tuple[bool, ...]) -> bool:
         return assignment[self.a_index] or assignment[self.b_index]
 
-    def to_solver_expr(self, W_vars: list) -> "BoolRef":
+    def evaluate_on_mask(self, W: int) -> bool:
+        return bool(W & (self._a_mask | self._b_mask))
+
+    def _build_solver_expr(self, W_vars: list) -> "BoolRef":
         # W[a] OR W[b]
         return z3.Or(W_vars[self.a_index], W_vars[self.b_index])
 
-    def to_english(self, names: list[str]) -> str:
-        return f"At least one of {names[self.a_index]} and {names[self.b_index]} is a werewolf."
-
     def complexity_cost(self) -> int:
         return 1
 
-    def to_short_string(self) -> str:
-        """Return short string representation: A-a-b"""
-        return f"A-{self.a_index}-{self.b_index}"
-
-    def get_accusations(self) -> set[tuple[int, int]]:
+    def _build_accusations(self) -> set[tuple[int, int]]:
         """Mutual accusation - if one is innocent, the other must be guilty."""
         return {(self.a_index, self.b_index), (self.b_index, self.a_index)}
 
-    def get_vouchings(self) -> set[tuple[int, int]]:
+    def _build_vouchings(self) -> set[tuple[int, int]]:
         """No vouchings - this is an accusatory statement."""
         return set()
 
@@ -454,37 +614,32 @@ class AtLeastOne(RelationshipStatement):
 class ExactlyOne(RelationshipStatement):
     """Semantics: W[a] XOR W[b] (i.e., W[a] != W[b])"""
 
-    def __init__(self, a_index: int, b_index: int):
-        """Initialize an ExactlyOne statement, normalizing indices for symmetry."""
-        # Normalize: always store min(a, b) as a_index, max(a, b) as b_index
-        super().__init__(min(a_index, b_index), max(a_index, b_index))
+    __slots__ = ()
 
-    @property
-    def statement_id(self) -> str:
-        return f"XOR({self.a_index},{self.b_index})"
+    _symmetric = True
+
+    _ID_PREFIX = "XOR"
+    _SHORT_CODE = "X"
+    _ENGLISH_TEMPLATE = "Exactly one of {a} and {b} is a werewolf."
 
     def evaluate_on_assignment(self, assignment: tuple[bool, ...]) -> bool:
         return assignment[self.a_index] != assignment[self.b_index]
 
-    def to_solver_expr(self, W_vars: list) -> "BoolRef":
+    def evaluate_on_mask(self, W: int) -> bool:
+        return bool(W & self._a_mask) != bool(W & self._b_mask)
+
+    def _build_solver_expr(self, W_vars: list) -> "BoolRef":
         # W[a] != W[b]
         return W_vars[self.a_index] != W_vars[self.b_index]
 
-    def to_english(self, names: list[str]) -> str:
-        return f"Exactly one of {names[self.a_index]} and {names[self.b_index]} is a werewolf."
-
     def complexity_cost(self) -> int:
         return 1
 
-    def to_short_string(self) -> str:
-        """Return short string representation: X-a-b"""
-        return f"X-{self.a_index}-{self.b_index}"
-
-    def get_accusations(self) -> set[tuple[int, int]]:
+    def _build_accusations(self) -> set[tuple[int, int]]:
         """Mutual accusation - one must be guilty, they're in opposition."""
         return {(self.a_index, self.b_index), (self.b_index, self.a_index)}
 
-    def get_vouchings(self) -> set[tuple[int, int]]:
+    def _build_vouchings(self) -> set[tuple[int, int]]:
         """No vouchings - they cannot both be innocent or both be guilty."""
         return set()
 
@@ -492,38 +647,33 @@ class ExactlyOne(RelationshipStatement):
 class AtMostOne(RelationshipStatement):
     """Semantics: NOT(W[a] AND W[b]) - at most one of them is a werewolf."""
 
-    def __init__(self, a_index: int, b_index: int):
-        """Initialize an AtMostOne statement, normalizing indices for symmetry."""
-        # Normalize: always store min(a, b) as a_index, max(a, b) as b_index
-        super().__init__(min(a_index, b_index), max(a_index, b_index))
+    __slots__ = ()
 
-    @property
-    def statement_id(self) -> str:
-        return f"NAND({self.a_index},{self.b_index})"
+    _symmetric = True
+
+    _ID_PREFIX = "NAND"
+    _SHORT_CODE = "T"
+    _ENGLISH_TEMPLATE = "At most one of {a} and {b} is a werewolf."
 
     def evaluate_on_assignment(self, assignment: tuple[bool, ...]) -> bool:
         # NOT(W[a] AND W[b]) = NOT W[a] OR NOT W[b]
         return not (assignment[self.a_index] and assignment[self.b_index])
 
-    def to_solver_expr(self, W_vars: list) -> "BoolRef":
+    def evaluate_on_mask(self, W: int) -> bool:
+        return not (W & self._a_mask) or not (W & self._b_mask)
+
+    def _build_solver_expr(self, W_vars: list) -> "BoolRef":
         # NOT(W[a] AND W[b])
         return z3.Not(z3.And(W_vars[self.a_index], W_vars[self.b_index]))
 
-    def to_english(self, names: list[str]) -> str:
-        return f"At most one of {names[self.a_index]} and {names[self.b_index]} is a werewolf."
-
     def complexity_cost(self) -> int:
         return 1
 
-    def to_short_string(self) -> str:
-        """Return short string representation: T-a-b"""
-        return f"T-{self.a_index}-{self.b_index}"
-
-    def get_accusations(self) -> set[tuple[int, int]]:
+    def _build_accusations(self) -> set[tuple[int, int]]:
         """No accusations - this is a mutual vouching relationship (at most one guilty)."""
         return set()
 
-    def get_vouchings(self) -> set[tuple[int, int]]:
+    def _build_vouchings(self) -> set[tuple[int, int]]:
         """Mutual partial vouching - if one is guilty, the other is innocent."""
         return {(self.a_index, self.b_index), (self.b_index, self.a_index)}
 
@@ -536,33 +686,31 @@ class IfNotAThenB(RelationshipStatement):
     Prefer using AtLeastOne for puzzle generation to avoid duplicates.
     """
 
-    @property
-    def statement_id(self) -> str:
-        return f"IMP_NOT({self.a_index},{self.b_index})"
+    __slots__ = ()
+
+    _ID_PREFIX = "IMP_NOT"
+    _SHORT_CODE = "F"
+    _ENGLISH_TEMPLATE = "If {a} is not a werewolf, then {b} is a werewolf."
 
     def evaluate_on_assignment(self, assignment: tuple[bool, ...]) -> bool:
         # (NOT W[a]) => W[b] is equivalent to W[a] OR W[b]
         return assignment[self.a_index] or assignment[self.b_index]
 
-    def to_solver_expr(self, W_vars: list) -> "BoolRef":
+    def evaluate_on_mask(self, W: int) -> bool:
+        return bool(W & (self._a_mask | self._b_mask))
+
+    def _build_solver_expr(self, W_vars: list) -> "BoolRef":
         # (NOT W[a]) => W[b]
         return z3.Implies(z3.Not(W_vars[self.a_index]), W_vars[self.b_index])
 
-    def to_english(self, names: list[str]) -> str:
-        return f"If {names[self.a_index]} is not a werewolf, then {names[self.b_index]} is a werewolf."
-
     def complexity_cost(self) -> int:
         return 1
 
-    def to_short_string(self) -> str:
-        """Return short string representation: F-a-b"""
-        return f"F-{self.a_index}-{self.b_index}"
-
-    def get_accusations(self) -> set[tuple[int, int]]:
+    def _build_accusations(self) -> set[tuple[int, int]]:
         """Mutual accusation - equivalent to AtLeastOne, at least one must be guilty."""
         return {(self.a_index, self.b_index), (self.b_index, self.a_index)}
 
-    def get_vouchings(self) -> set[tuple[int, int]]:
+    def _build_vouchings(self) -> set[tuple[int, int]]:
         """No vouchings - this is an accusatory statement."""
         return set()
 
@@ -570,37 +718,32 @@ class IfNotAThenB(RelationshipStatement):
 class Neither(RelationshipStatement):
     """Semantics: (NOT W[a]) AND (NOT W[b])"""
 
-    def __init__(self, a_index: int, b_index: int):
-        """Initialize a Neither statement, normalizing indices for symmetry."""
-        # Normalize: always store min(a, b) as a_index, max(a, b) as b_index
-        super().__init__(min(a_index, b_index), max(a_index, b_index))
+    __slots__ = ()
 
-    @property
-    def statement_id(self) -> str:
-        return f"NEITHER({self.a_index},{self.b_index})"
+    _symmetric = True
+
+    _ID_PREFIX = "NEITHER"
+    _SHORT_CODE = "N"
+    _ENGLISH_TEMPLATE = "Neither {a} nor {b} is a werewolf."
 
     def evaluate_on_assignment(self, assignment: tuple[bool, ...]) -> bool:
         return not assignment[self.a_index] and not assignment[self.b_index]
 
-    def to_solver_expr(self, W_vars: list) -> "BoolRef":
+    def evaluate_on_mask(self, W: int) -> bool:
+        return not (W & (self._a_mask | self._b_mask))
+
+    def _build_solver_expr(self, W_vars: list) -> "BoolRef":
         # (NOT W[a]) AND (NOT W[b])
         return z3.And(z3.Not(W_vars[self.a_index]), z3.Not(W_vars[self.b_index]))
 
-    def to_english(self, names: list[str]) -> str:
-        return f"Neither {names[self.a_index]} nor {names[self.b_index]} is a werewolf."
-
     def complexity_cost(self) -> int:
         return 2  # Higher cost as this is a strong statement
 
-    def to_short_string(self) -> str:
-        """Return short string representation: N-a-b"""
-        return f"N-{self.a_index}-{self.b_index}"
-
-    def get_accusations(self) -> set[tuple[int, int]]:
+    def _build_accusations(self) -> set[tuple[int, int]]:
         """No accusations - both are asserted innocent."""
         return set()
 
-    def get_vouchings(self) -> set[tuple[int, int]]:
+    def _build_vouchings(self) -> set[tuple[int, int]]:
         """Mutual vouching - both are asserted innocent, they share innocence."""
         return {(self.a_index, self.b_index), (self.b_index, self.a_index)}
 
@@ -619,6 +762,33 @@ class CountWerewolves(CountStatement):
     - count="odd": SUM(W[i]) % 2 == 1
     """
 
+    __slots__ = (
+        "count",
+        "comparison",
+        "_parity_bit",
+        "_statement_id",
+        "_short_string",
+        "_english_template",
+        "_english_name_indices",
+    )
+
+    # Flyweight pool, as in RelationshipStatement. Keyed on the scope tuple
+    # as given (not sorted) so reconstruction preserves scope order.
+    _intern: "WeakValueDictionary[tuple, CountWerewolves]" = WeakValueDictionary()
+
+    def __new__(
+        cls,
+        scope_indices: tuple[int, ...],
+        count: int | str,
+        comparison: str = "exactly",
+    ):
+        key = (tuple(scope_indices), count, comparison)
+        inst = cls._intern.get(key)
+        if inst is None:
+            inst = super().__new__(cls)
+            cls._intern[key] = inst
+        return inst
+
     def __init__(
         self,
         scope_indices: tuple[int, ...],
@@ -634,6 +804,11 @@ class CountWerewolves(CountStatement):
                        Ignored for parity counts ("odd"/"even").
         """
         super().__init__(scope_indices)
+        if getattr(self, "_statement_id", None) is not None:
+            # Interned instance returned by __new__; already initialized.
+            # Only valid argument combinations ever reach the pool, so the
+            # validation below has already passed for this instance.
+            return
         if isinstance(count, str) and count not in ("odd", "even"):
             raise ValueError(f"count must be int, 'odd', or 'even', got: {count}")
         if isinstance(count, int) and comparison not in (
@@ -646,88 +821,135 @@ class CountWerewolves(CountStatement):
             )
         self.count = count
         self.comparison = comparison if isinstance(count, int) else None
-
-    @property
-    def _is_parity(self) -> bool:
-        """Return True if this is a parity statement."""
-        return isinstance(self.count, str)
-
-    @property
-    def statement_id(self) -> str:
-        scope_str = ",".join(map(str, sorted(self.scope_indices)))
+        # Parity resolved to a bit once: the evaluators compare the low bit
+        # of the count against it instead of re-checking the count string
+        # and taking a modulo on every call. None for numeric counts.
+        self._parity_bit = (1 if count == "odd" else 0) if self._is_parity else None
+        # Identifier strings formatted once: both sort the scope for
+        # canonical form, so hash-heavy dedup paths skip the per-call
+        # sorted() plus f-string work.
+        sorted_scope = sorted(scope_indices)
+        scope_str = ",".join(map(str, sorted_scope))
+        short_scope = ".".join(map(str, sorted_scope))
         if self._is_parity:
-            if self.count == "even":
-                return f"COUNT_EVEN(scope=[{scope_str}])"
+            if count == "even":
+                statement_id = f"COUNT_EVEN(scope=[{scope_str}])"
+                short_string = f"V-{short_scope}"
             else:  # odd
-                return f"COUNT_ODD(scope=[{scope_str}])"
+                statement_id = f"COUNT_ODD(scope=[{scope_str}])"
+                short_string = f"O-{short_scope}"
+        elif self.comparison == "exactly":
+            statement_id = f"COUNT_EQ(scope=[{scope_str}],count={count})"
+            short_string = f"E-{short_scope}-{count}"
+        elif self.comparison == "at_most":
+            statement_id = f"COUNT_LE(scope=[{scope_str}],count={count})"
+            short_string = f"M-{short_scope}-{count}"
+        else:  # at_least
+            statement_id = f"COUNT_GE(scope=[{scope_str}],count={count})"
+            short_string = f"L-{short_scope}-{count}"
+        # Interned like the relationship ids: logically equal statements
+        # with reordered scopes are distinct objects, and interning lets
+        # their id comparisons and cache lookups hit pointer equality.
+        self._statement_id = sys.intern(statement_id)
+        self._short_string = sys.intern(short_string)
+        # English template precomputed: everything except the villager names
+        # is fixed at construction, so to_english is one str.format call.
+        # Small scopes keep {i} placeholders for the names; larger scopes
+        # use the constant "k villagers" description.
+        k = len(scope_indices)
+        if k == 1:
+            scope_desc = "{0}"
+            self._english_name_indices = scope_indices
+        elif k <= 3:
+            scope_desc = (
+                ", ".join("{%d}" % j for j in range(k - 1)) + ", and {%d}" % (k - 1)
+            )
+            self._english_name_indices = scope_indices
         else:
-            if self.comparison == "exactly":
-                return f"COUNT_EQ(scope=[{scope_str}],count={self.count})"
-            elif self.comparison == "at_most":
-                return f"COUNT_LE(scope=[{scope_str}],count={self.count})"
-            else:  # at_least
-                return f"COUNT_GE(scope=[{scope_str}],count={self.count})"
-
-    def evaluate_on_assignment(self, assignment: tuple[bool, ...]) -> bool:
-        werewolf_count = sum(1 for i in self.scope_indices if assignment[i])
+            scope_desc = f"{k} villagers"
+            self._english_name_indices = ()
         if self._is_parity:
-            if self.count == "even":
-                return werewolf_count % 2 == 0
-            else:  # odd
-                return werewolf_count % 2 == 1
+            parity = "even" if count == "even" else "odd"
+            self._english_template = (
+                f"An {parity} number of werewolves among {scope_desc}."
+            )
         else:
+            wolves_word = "werewolf" if count == 1 else "werewolves"
             if self.comparison == "exactly":
-                return werewolf_count == self.count
+                qualifier = "exactly"
             elif self.comparison == "at_most":
-                return werewolf_count <= self.count
+                qualifier = "at most"
             else:  # at_least
-                return werewolf_count >= self.count
+                qualifier = "at least"
+            self._english_template = (
+                f"There are {qualifier} {count} {wolves_word} among {scope_desc}."
+            )
+        self._hash = hash(self._statement_id)
 
-    def to_solver_expr(self, W_vars: list) -> "BoolRef":
-        total = sum(z3.If(W_vars[i], 1, 0) for i in self.scope_indices)
+    @property
+    def _is_parity(self) -> bool:
+        """Return True if this is a parity statement."""
+        return isinstance(self.count, str)
+
+    def __reduce__(self):
+        """Pickle/copy support: rebuild through the interning constructor."""
+        return (
+            self.__class__,
+            (self.scope_indices, self.count, self.comparison or "exactly"),
+        )
+
+    def evaluate_on_assignment(self, assignment: tuple[bool, ...]) -> bool:
+        werewolf_count = sum(1 for i in self.scope_indices if assignment[i])
+        parity_bit = self._parity_bit
+        if parity_bit is not None:
+            return werewolf_count & 1 == parity_bit
+        if self.comparison == "exactly":
+            return werewolf_count == self.count
+        elif self.comparison == "at_most":
+            return werewolf_count <= self.count
+        else:  # at_least
+            return werewolf_count >= self.count
+
+    def evaluate_on_mask(self, W: int) -> bool:
+        parity_bit = self._parity_bit
+        if parity_bit is not None:
+            # Parity only needs the low bit of the popcount: AND, POPCNT,
+            # AND 1 — no modulo and no count-string comparison per call
+            return (W & self._scope_mask).bit_count() & 1 == parity_bit
+        werewolf_count = (W & self._scope_mask).bit_count()
+        if self.comparison == "exactly":
+            return werewolf_count == self.count
+        elif self.comparison == "at_most":
+            return werewolf_count <= self.count
+        else:  # at_least
+            return werewolf_count >= self.count
+
+    def _build_solver_expr(self, W_vars: list) -> "BoolRef":
         if self._is_parity:
+            # No native parity constraint in Z3, so keep the arithmetic
+            # form; z3.Sum builds one n-ary addition node instead of the
+            # left-nested chain (and per-term API crossings) Python's
+            # sum() would produce
+            total = z3.Sum([z3.If(W_vars[i], 1, 0) for i in self.scope_indices])
             if self.count == "even":
                 return total % 2 == 0
             else:  # odd
                 return total % 2 == 1
-        else:
-            if self.comparison == "exactly":
-                return total == self.count
-            elif self.comparison == "at_most":
-                return total <= self.count
-            else:  # at_least
-                return total >= self.count
-
-    def _scope_description(self, names: list[str]) -> str:
-        """Generate English description of the scope."""
-        scope_names = [names[i] for i in self.scope_indices]
-        if len(scope_names) == 1:
-            return scope_names[0]
-        elif len(scope_names) <= 3:
-            return ", ".join(scope_names[:-1]) + f", and {scope_names[-1]}"
-        else:
-            return f"{len(scope_names)} villagers"
+        # Native pseudo-boolean cardinality constraints: smaller to build
+        # than a Sum(If(...)) comparison and handled by Z3's dedicated
+        # cardinality propagators
+        pairs = [(W_vars[i], 1) for i in self.scope_indices]
+        if self.comparison == "exactly":
+            return z3.PbEq(pairs, self.count)
+        elif self.comparison == "at_most":
+            return z3.PbLe(pairs, self.count)
+        else:  # at_least
+            return z3.PbGe(pairs, self.count)
 
     def to_english(self, names: list[str]) -> str:
-        scope_desc = self._scope_description(names)
-        if self._is_parity:
-            parity = "even" if self.count == "even" else "odd"
-            return f"An {parity} number of werewolves among {scope_desc}."
-        else:
-            count_val = self.count
-            wolves_word = "werewolf" if count_val == 1 else "werewolves"
-            if self.comparison == "exactly":
-                return (
-                    f"There are exactly {count_val} {wolves_word} among {scope_desc}."
-                )
-            elif self.comparison == "at_most":
-                return (
-                    f"There are at most {count_val} {wolves_word} among {scope_desc}."
-                )
-            else:  # at_least
-                return (
-                    f"There are at least {count_val} {wolves_word} among {scope_desc}."
-                )
+        return self._english_template.format(
+            *[names[i] for i in self._english_name_indices]
+        )
 
     def complexity_cost(self) -> int:
         if self._is_parity:
@@ -737,30 +959,6 @@ class CountWerewolves(CountStatement):
         else:
             return 2
 
-    def to_short_string(self) -> str:
-        """Return short string representation.
-
-        Format:
-        - E-scope-count for exactly (e.g., E-0.1.2-2)
-        - M-scope-count for at_most (e.g., M-0.1-1)
-        - L-scope-count for at_least (e.g., L-0.1.2.3-2)
-        - V-scope for even (e.g., V-0.1.2)
-        - O-scope for odd (e.g., O-0.1)
-        """
-        scope_str = ".".join(map(str, sorted(self.scope_indices)))
-        if self._is_parity:
-            if self.count == "even":
-                return f"V-{scope_str}"
-            else:  # odd
-                return f"O-{scope_str}"
-        else:
-            if self.comparison == "exactly":
-                return f"E-{scope_str}-{self.count}"
-            elif self.comparison == "at_most":
-                return f"M-{scope_str}-{self.count}"
-            else:  # at_least
-                return f"L-{scope_str}-{self.count}"
-
     def to_dict(self) -> dict:
         """Convert count statement to dictionary.
 
@@ -776,13 +974,83 @@ class CountWerewolves(CountStatement):
             result["comparison"] = self.comparison
         return result
 
-    def get_accusations(self) -> set[tuple[int, int]]:
+    def get_accusations(self) -> frozenset[tuple[int, int]]:
         """No direct inter-person accusations for count statements."""
-        return set()
+        return _NO_PAIRS
 
-    def get_vouchings(self) -> set[tuple[int, int]]:
+    def get_vouchings(self) -> frozenset[tuple[int, int]]:
         """No direct inter-person vouchings for count statements."""
-        return set()
+        return _NO_PAIRS
+
+
+# Dispatch tables for the Statement factory classmethods, built once the
+# concrete classes exist. from_dict / from_short_string resolve types and
+# codes with a single dict lookup instead of an if/elif walk.
+_RELATIONSHIP_TYPE_DISPATCH: dict[str, type] = {
+    cls.__name__: cls
+    for cls in (
+        IfAThenB,
+        BothOrNeither,
+        AtLeastOne,
+        ExactlyOne,
+        AtMostOne,
+        IfNotAThenB,
+        Neither,
+    )
+}
+
+# Legacy count type name -> (count, comparison); count None means "read the
+# numeric count from the dict".
+_LEGACY_COUNT_TYPE_DISPATCH: dict[str, tuple] = {
+    "ExactlyKWerewolves": (None, "exactly"),
+    "AtMostKWerewolves": (None, "at_most"),
+    "AtLeastKWerewolves": (None, "at_least"),
+    "EvenNumberOfWerewolves": ("even", None),
+    "OddNumberOfWerewolves": ("odd", None),
+}
+
+_SHORT_RELATIONSHIP_DISPATCH: dict[str, type] = {
+    "I": IfAThenB,
+    "B": BothOrNeither,
+    "A": AtLeastOne,
+    "X": ExactlyOne,
+    "F": IfNotAThenB,
+    "T": AtMostOne,
+    "N": Neither,
+}
+
+# Short code -> CountWerewolves count/comparison kind
+_SHORT_COUNT_DISPATCH: dict[str, str] = {
+    "E": "exactly",
+    "M": "at_most",
+    "L": "at_least",
+    "V": "even",
+    "O": "odd",
+}
+
+
+def statements_from_short_string(statements_str: str) -> list[Statement]:
+    """Parse an underscore-joined short-string list back into statements.
+
+    Inverse of Puzzle.to_short_statements_string, and the preferred wire
+    format for bulk statement I/O: one str.split plus one dispatch lookup
+    per statement, with no per-statement dict or JSON involved. The short
+    format does not encode speaker grouping, so the result is the flat
+    statement list in the order it was serialized.
+
+    Args:
+        statements_str: String like "I-5-7_N-3-4_B-0-1" (may be empty)
+
+    Returns:
+        List of Statement instances (empty for an empty string)
+
+    Raises:
+        ValueError: If any component is not a valid short string
+    """
+    if not statements_str:
+        return []
+    from_short_string = Statement.from_short_string
+    return [from_short_string(part) for part in statements_str.split("_")]
 
 
 # Backwards-compatible factory functions for old class names
@@ -1,8 +1,9 @@
 """Truth table caching using bitmask representation."""
 
-import json
 from typing import TYPE_CHECKING
 
+from ._json import dumps, loads
+
 if TYPE_CHECKING:
     from .statements import Statement
 
@@ -114,7 +115,13 @@ def compute_shill_masks(N: int, M_star: tuple[bool, ...]) -> list[int]:
 
 
 class StatementTruthTableCache:
-    """Cache of truth masks for statements."""
+    """Cache of truth masks for statements.
+
+    Masks are plain Python ints with one bit per assignment (2^N bits).
+    For N <= 6 the whole mask fits in a single 64-bit digit, so the
+    AND/OR/popcount operations in the hot loops stay machine-word sized
+    with no multi-digit bignum work.
+    """
 
     def __init__(
         self, N: int, statement_id_to_truth_mask: dict[str, int] | None = None
@@ -127,6 +134,16 @@ class StatementTruthTableCache:
         """
         self.N = N
         self.statement_id_to_truth_mask = statement_id_to_truth_mask or {}
+        # Precomputed once: callers combine masks in hot loops and would
+        # otherwise rebuild these (1 << 2^N)-sized ints on every call.
+        self.num_assignments = 1 << N
+        self.all_assignments_mask = (1 << self.num_assignments) - 1
+        # Identity-keyed memo for get_truth_mask: the library statements are
+        # long-lived objects looked up thousands of times per generation, and
+        # each statement_id access rebuilds an f-string before hashing it.
+        # The keepalive list pins memoized statements so ids stay unique.
+        self._mask_by_identity: dict[int, int] = {}
+        self._memoized_statements: list["Statement"] = []
 
     @classmethod
     def build_for_statement_library(
@@ -142,15 +159,15 @@ class StatementTruthTableCache:
             StatementTruthTableCache with precomputed truth masks
         """
         statement_id_to_truth_mask = {}
-        all_assignments_mask = (1 << N) - 1
 
         for statement in statement_library:
             truth_mask = 0
 
-            # Evaluate statement on all 2^N assignments
+            # Evaluate statement on all 2^N assignments. The assignment index
+            # is itself the packed bitmask (bit i = villager i), so the
+            # bitwise evaluator applies directly with no tuple conversion.
             for assignment_idx in range(1 << N):
-                assignment = index_to_assignment(assignment_idx, N)
-                if statement.evaluate_on_assignment(assignment):
+                if statement.evaluate_on_mask(assignment_idx):
                     truth_mask |= 1 << assignment_idx
 
             statement_id_to_truth_mask[statement.statement_id] = truth_mask
@@ -173,7 +190,7 @@ class StatementTruthTableCache:
             },
         }
         with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+            f.write(dumps(data, indent_2=True))
 
     @classmethod
     def load_from_json(cls, path: str) -> "StatementTruthTableCache":
@@ -186,7 +203,7 @@ class StatementTruthTableCache:
             StatementTruthTableCache loaded from file
         """
         with open(path, "r") as f:
-            data = json.load(f)
+            data = loads(f.read())
 
         N = data["N"]
         statement_id_to_truth_mask = {
@@ -208,7 +225,12 @@ class StatementTruthTableCache:
         Raises:
             KeyError: If statement is not in cache
         """
-        return self.statement_id_to_truth_mask[statement.statement_id]
+        mask = self._mask_by_identity.get(id(statement))
+        if mask is None:
+            mask = self.statement_id_to_truth_mask[statement.statement_id]
+            self._mask_by_identity[id(statement)] = mask
+            self._memoized_statements.append(statement)
+        return mask
 
     def get_false_mask(self, statement: "Statement") -> int:
         """Get the false mask for a statement (complement of truth mask).
@@ -219,7 +241,5 @@ class StatementTruthTableCache:
         Returns:
             False mask (bitmask of assignments where statement is False)
         """
-        num_assignments = 1 << self.N
-        all_assignments_mask = (1 << num_assignments) - 1
         truth_mask = self.get_truth_mask(statement)
-        return all_assignments_mask & (~truth_mask)
+        return self.all_assignments_mask & (~truth_mask)
@@ -16,6 +16,7 @@ from src.statements import (
     Neither,
     OddNumberOfWerewolves,
     Statement,
+    statements_from_short_string,
 )
 
 
@@ -487,3 +488,20 @@ def test_puzzle_to_short_statements_string():
         f"Expected {expected_parts}, got {actual_parts}"
     )
 
+
+def test_statements_from_short_string_round_trip():
+    """Test that the bulk short-string codec inverts to_short_statements_string."""
+    statements = [
+        IfAThenB(5, 7),
+        Neither(3, 4),
+        BothOrNeither(0, 1),
+        ExactlyKWerewolves((0, 1, 2), 2),
+        OddNumberOfWerewolves((0, 1)),
+    ]
+    joined = "_".join(stmt.to_short_string() for stmt in statements)
+
+    reconstructed = statements_from_short_string(joined)
+
+    assert reconstructed == statements
+    assert statements_from_short_string("") == []
+